@@ -0,0 +1,15 @@
+# Cleaning robot simulation: a room full of chairs, trolleys and people, and a bot that cleans them.
+# Importing the package has no side effects; ipythonblocks and IPython are only imported once something
+# is drawn in a notebook.
+from .agents import Agent, CleanBot, Direction
+from .batch import BatchProgram, BatchRooms
+from .environment import Environment, RunResult, Snapshot
+from .layout import COLORS, make_room, random_room_size
+from .navigation import DistanceField
+from .path import Path
+from .percepts import Percept
+from .programs import CleanProgram, OracleProgram, TripProgram, program
+from .render import BlockGridView, FrameExporter, ThreadedRenderer
+from .room import roomarea
+from .termination import AllCleaned, CoverageReached, LiquidExhausted, StepBudget
+from .things import CLASS_IDS, Bump, Chair, Person, Thing, Trolley
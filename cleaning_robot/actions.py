@@ -0,0 +1,44 @@
+from .agents import Direction
+
+# the primitive moves every movement action makes from each starting heading (up, right, down, left):
+# F is forward, L and R are turns. The clean* ones are what the old if/elif chain in execute_action did,
+# including the branches that carried on into the next heading's branch after turning
+MACROS = {
+    'moveforward': ('F', 'F', 'F', 'F'),
+    'turnleft': ('L', 'L', 'L', 'L'),
+    'turnright': ('R', 'R', 'R', 'R'),
+    'cleanup': ('F', 'LFF', 'LLF', 'RFF'),
+    'cleandown': ('LLFF', 'RFF', 'F', 'LFF'),
+    'cleanleft': ('LF', 'LLFF', 'RF', 'F'),
+    'cleanright': ('RF', 'F', 'LF', 'LLF'),
+    'cleanupleft': ('FLF', 'LFLFRFLF', 'LLFLF', 'RFLF'),
+    'cleanupright': ('FRF', 'LFRF', 'LLFRF', 'RFRF'),
+    'cleandownleft': ('LLFRF', 'RFRFLFRF', 'FRF', 'LFRF'),
+    'cleandownright': ('LLFLF', 'RFLF', 'FLF', 'LFLF'),
+}
+
+FORWARD, TURN_LEFT, TURN_RIGHT = 1, 2, 3
+PRIMITIVES = {'F': FORWARD, 'L': TURN_LEFT, 'R': TURN_RIGHT}
+
+
+def compile_routine(moves):
+    return tuple(PRIMITIVES[move] for move in moves)
+
+
+def compile_macros(macros=MACROS):
+    # (action, heading) -> the primitives it comes down to
+    return {(name, heading): compile_routine(moves)
+            for name, sequences in macros.items() for heading, moves in enumerate(sequences)}
+
+
+ROUTINES = compile_macros()
+
+
+def run_routine(agent, routine):
+    for primitive in routine:
+        if primitive == FORWARD:
+            agent.moveforward()
+        elif primitive == TURN_LEFT:
+            agent.turn(Direction.L)
+        else:
+            agent.turn(Direction.R)
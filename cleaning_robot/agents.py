@@ -0,0 +1,205 @@
+import collections.abc
+
+from .path import Path
+from .rng import RandomStream
+from .things import Chair, Person, Thing, Trolley
+
+
+# agents specification from other things
+class Agent(Thing):
+
+    def __init__(self, program=None, seed=None):
+        #when the bots work is done it's easy to kill it and thus no further actions should take place
+        self._alive = True
+        self.bump = False
+        self.holding = []
+        self.performance = 0
+        # set by the environment when the agent is added so moves can update its cell index
+        self.environment = None
+        # the agent's own random numbers, see rng.py
+        self.rng = RandomStream(seed)
+        if program is None or not isinstance(program, collections.abc.Callable):
+            print("Can't find a valid program for {}, falling back to default.".format(self.__class__.__name__))
+
+            def program(percept):
+                return eval(input('Percept={}; action? '.format(percept)))
+
+        # a program class (like CleanProgram) is bound to this agent by building an instance for it
+        if isinstance(program, type):
+            program = program(self)
+        self.program = program
+
+    @property
+    def alive(self):
+        return self._alive
+
+    @alive.setter
+    def alive(self, alive):
+        # the environment keeps count of its living agents so it doesn't have to check them all every step
+        if self.environment is not None and alive != self._alive:
+            self.environment.alive_agents += 1 if alive else -1
+        self._alive = alive
+
+
+class Direction:
+    # headings are ints clockwise from up so turning and moving are table lookups, and there is one shared
+    # Direction per heading: Direction("down"), Direction(Direction.D) and every turn hand back one of the
+    # same four objects instead of building new ones
+    U, R, D, L = range(4)
+    NAMES = ('up', 'right', 'down', 'left')
+    CODES = {name: code for code, name in enumerate(NAMES)}
+    # the step forward from each heading
+    DX = (0, 1, 0, -1)
+    DY = (-1, 0, 1, 0)
+
+    def __new__(cls, direction):
+        if isinstance(direction, Direction):
+            return direction
+        return cls.HEADINGS[cls.CODES.get(direction, direction)]
+
+    def __add__(self, heading):
+        # turning right or left (Direction.R / Direction.L, or their names), anything else gives None
+        return self.TURNED[self.direction].get(heading)
+
+    def move_forward(self, from_location):
+        # get the iterable class to return
+        x, y = from_location
+        return from_location.__class__((x + self.DX[self.direction], y + self.DY[self.direction]))
+
+    def __eq__(self, other):
+        if isinstance(other, Direction):
+            return self is other
+        return self.direction == self.CODES.get(other, other)
+
+    def __hash__(self):
+        return self.direction
+
+    def __repr__(self):
+        return 'Direction({!r})'.format(self.NAMES[self.direction])
+
+    # copies and unpickled bots get the shared heading back rather than a new object
+    def __reduce__(self):
+        return (Direction, (self.direction,))
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+
+def build_headings():
+    headings = []
+    for code in range(4):
+        heading = object.__new__(Direction)
+        heading.direction = code
+        headings.append(heading)
+    Direction.HEADINGS = tuple(headings)
+    # heading -> turn -> heading after turning, keyed by the turn's code and its name
+    Direction.TURNED = tuple({turn: headings[(code + turn) % 4] for turn in (Direction.R, Direction.L)}
+                             for code in range(4))
+    for turned in Direction.TURNED:
+        turned.update({Direction.NAMES[turn]: heading for turn, heading in list(turned.items())})
+
+
+build_headings()
+
+
+class CleanBot(Agent):
+    def __init__(self, program=None, optimal=False, seed=None, path_limit=None, path_rle=False, refill=False):
+        super().__init__(program, seed)
+        self.location = [0, 0]
+        self.cleaningliquid = 1
+        # how much the tank holds, and whether the bot fills it up again at base (0, 0) rather than stopping
+        # once it's empty
+        self.capacity = 1
+        self.refill = refill
+        self.direction = Direction("down")
+        self.optimal = optimal
+        # every location the bot has been to, see path.py for keeping only the newest path_limit of them
+        self.path = Path(path_limit, path_rle)
+        self.path.append(self.location)
+        self.needed_cleaning = []
+
+    # These are to make it such that the bot can clean a specific number of items before returning
+    # (in the run block I set the number of items it can clean to the number of chairs and trolleys created so it will clean them all)
+    def addLiquid(self, amount):
+        self.cleaningliquid = amount
+        self.capacity = amount
+
+    def refillLiquid(self):
+        self.cleaningliquid = self.capacity
+
+    def useLiquid(self):
+        self.cleaningliquid = self.cleaningliquid - 1
+
+    """def faceup(self):
+        print("faceup")
+        print(self.direction)
+        if self.direction == Direction("down"):
+            return 'turnleft', 'turnleft', 'goup'
+        if self.direction == Direction("left"):
+            return 'turnright', 'goup'
+        if self.direction == Direction("right"):
+            return 'turnleft', 'goup'
+        if self.direction == Direction("up"):
+            return 'goup'
+
+    def goup(self):
+        print("goup")
+        if self.location[1] != 0:
+            return 'goup'
+        if self.location[1] == 0:
+            return 'faceleft'
+
+    def faceleft(self):
+        if self.direction == Direction("down"):
+            return 'turnright', 'goleft'
+        if self.direction == Direction("left"):
+            return 'goleft'
+        if self.direction == Direction("right"):
+            return 'turnleft', 'turnleft', 'goleft'
+        if self.direction == Direction("up"):
+            return 'turnleft', 'goleft'
+
+    def goleft(self):
+        if self.location[0] != 0:
+            return 'goleft'
+        if self.location[1] == 0:
+            return 'end'"""
+
+    def moveforward(self, success=True):
+        # moveforward possible only if success (i.e. valid destination location)
+        if not success:
+            return
+        d = self.direction.direction
+        location = [self.location[0] + Direction.DX[d], self.location[1] + Direction.DY[d]]
+
+        # going through the environment keeps its cell index up to date
+        if self.environment is not None:
+            self.environment.move_thing(self, location)
+        else:
+            self.location = location
+        self.path.append(self.location)
+
+    def turn(self, d):
+        self.direction = self.direction + d
+
+    # I have a seperate functions for each of the objects I must clean however I believe I could have combined them with
+    # with an or statement in the if
+    def CleanTrolley(self, thing):
+        # returns True upon success or False otherwise#
+        if isinstance(thing, Trolley):
+            return True
+        return False
+
+    def CleanChair(self, thing):
+        if isinstance(thing, Chair):
+            return True
+        return False
+
+    def bumpPerson(self, thing):
+        # returns True upon success or False otherwise
+        if isinstance(thing, Person):
+            return True
+        return False
@@ -0,0 +1,242 @@
+# Batched simulation: thousands of rooms held as stacked NumPy arrays and stepped together, for evaluating
+# policies where stepping roomarea instances one at a time would be bound by interpreter speed.
+# Rooms all share one size. Each room has a single bot and the same actions roomarea understands.
+import numpy as np
+
+from .actions import FORWARD, MACROS, PRIMITIVES
+from .percepts import NEIGHBOURS
+from .things import CLASS_IDS
+
+CHAIR = CLASS_IDS['Chair']
+TROLLEY = CLASS_IDS['Trolley']
+PERSON = CLASS_IDS['Person']
+# every room grid carries a one cell border of this so percepts and moves never index outside it
+WALL = 255
+# more moves than any way home can take
+UNREACHABLE = np.iinfo(np.int64).max // 2
+
+# headings clockwise from up (the same codes Direction uses), and the step moving forward takes from each
+UP, RIGHT, DOWN, LEFT = range(4)
+HEADINGS = {'up': UP, 'right': RIGHT, 'down': DOWN, 'left': LEFT}
+DX = np.array([0, 1, 0, -1])
+DY = np.array([-1, 0, 1, 0])
+
+ACTIONS = ('', 'moveforward', 'turnleft', 'turnright', 'CleanChair', 'CleanTrolley',
+           'cleanup', 'cleandown', 'cleanleft', 'cleanright',
+           'cleanupleft', 'cleanupright', 'cleandownleft', 'cleandownright')
+ACTION_CODES = {name: code for code, name in enumerate(ACTIONS)}
+
+# how much each primitive code from actions.py turns the heading by (clockwise quarter turns)
+TURNS = np.array([0, 0, 3, 1])
+
+
+def compile_macros():
+    # action code x starting heading x position -> primitive, padded with 0 (do nothing)
+    length = max(len(moves) for sequences in MACROS.values() for moves in sequences)
+    table = np.zeros((len(ACTIONS), 4, length), dtype=np.int8)
+    for name, sequences in MACROS.items():
+        for heading, moves in enumerate(sequences):
+            table[ACTION_CODES[name], heading, :len(moves)] = [PRIMITIVES[move] for move in moves]
+    return table
+
+
+PROGRAMS = compile_macros()
+
+# the neighbours in the order CleanProgram looks at them, the clean actions that go there and the ones that
+# come back
+NEIGHBOUR_X = np.array([dx + 1 for dx, dy in NEIGHBOURS])
+NEIGHBOUR_Y = np.array([dy + 1 for dx, dy in NEIGHBOURS])
+GO_CLEAN = np.array([ACTION_CODES[name] for name in (
+    'cleanup', 'cleandown', 'cleanleft', 'cleanright',
+    'cleanupleft', 'cleanupright', 'cleandownleft', 'cleandownright')])
+COME_BACK = np.array([ACTION_CODES[name] for name in (
+    'cleandown', 'cleanup', 'cleanright', 'cleanleft',
+    'cleandownright', 'cleandownleft', 'cleanupright', 'cleanupleft')])
+
+
+class BatchRooms:
+    # grids is (rooms, width, height) of class ids for the chairs, trolleys and people (no bots),
+    # positions is (rooms, 2) of bot x, y, headings and liquid are one value per room.
+    # Unlike CleanBot, a bot here can't walk out of its room: a move into the wall leaves it where it is
+    def __init__(self, grids, positions, headings, liquid):
+        rooms, width, height = grids.shape
+        self.width = width
+        self.height = height
+        self.grids = np.full((rooms, width + 2, height + 2), WALL, dtype=np.uint8)
+        self.grids[:, 1:-1, 1:-1] = grids
+        self.positions = np.array(positions, dtype=np.int64).reshape(rooms, 2)
+        self.headings = np.array(headings, dtype=np.int64).reshape(rooms)
+        self.liquid = np.array(liquid, dtype=np.int64).reshape(rooms)
+        self.done = np.zeros(rooms, dtype=bool)
+        self.steps = np.zeros(rooms, dtype=np.int64)
+        self.cleaned = np.zeros(rooms, dtype=np.int64)
+        self.rows = np.arange(rooms)
+        self.retire()
+
+    def __len__(self):
+        return len(self.rows)
+
+    @classmethod
+    def from_rooms(cls, rooms):
+        # takes a list of roomarea instances, each with one CleanBot in it
+        from .things import Chair, Person, Trolley
+
+        grids = np.zeros((len(rooms), rooms[0].width, rooms[0].height), dtype=np.uint8)
+        positions, headings, liquid = [], [], []
+        for grid, room in zip(grids, rooms):
+            for tclass, class_id in ((Chair, CHAIR), (Trolley, TROLLEY), (Person, PERSON)):
+                for x, y in room.registries[tclass]:
+                    grid[x, y] = class_id
+            bot = next(iter(room.agents))
+            positions.append(bot.location)
+            headings.append(bot.direction.direction)
+            liquid.append(bot.cleaningliquid)
+        return cls(grids, positions, headings, liquid)
+
+    @classmethod
+    def random(cls, rooms, width, height, chairs, people, trolleys, liquid=None, rng=None):
+        # every room gets its own random layout, drawn for all rooms at once. Bots start at (0, 0) facing
+        # down with enough liquid for every chair and trolley unless told otherwise
+        rng = np.random.default_rng(rng)
+        placed = chairs + people + trolleys
+        if placed > width * height - 1:
+            raise ValueError("{} objects don't fit in a {}x{} room".format(placed, width, height))
+        # ranking random keys picks distinct cells per room; flat cell 0 is the start so it's left out
+        keys = rng.random((rooms, width * height - 1))
+        cells = np.argpartition(keys, placed - 1, axis=1)[:, :placed] + 1 if placed else \
+            np.zeros((rooms, 0), dtype=np.int64)
+        grids = np.zeros((rooms, width * height), dtype=np.uint8)
+        ids = np.repeat([CHAIR, PERSON, TROLLEY], [chairs, people, trolleys])
+        grids[np.arange(rooms)[:, None], cells] = ids
+        liquid = chairs + trolleys if liquid is None else liquid
+        return cls(grids.reshape(rooms, width, height), np.zeros((rooms, 2)), np.full(rooms, DOWN),
+                   np.full(rooms, liquid))
+
+    def percepts(self):
+        # the 3x3 class ids around every bot, (rooms, 3, 3) indexed [room, dx + 1, dy + 1]; WALL outside
+        xs = self.positions[:, 0, None, None] + np.arange(3)[None, :, None]
+        ys = self.positions[:, 1, None, None] + np.arange(3)[None, None, :]
+        return self.grids[self.rows[:, None, None], xs, ys]
+
+    def bumps(self):
+        # whether each bot is facing the wall
+        return self.grids[self.rows, self.positions[:, 0] + 1 + DX[self.headings],
+                          self.positions[:, 1] + 1 + DY[self.headings]] == WALL
+
+    def distances_home(self):
+        # moves from every cell back to (0, 0) going round people, (rooms, width + 2, height + 2) like
+        # self.grids, UNREACHABLE for walls, people and cells they cut off. Relaxed for all rooms at once
+        # until nothing changes, which takes as many rounds as the longest way home
+        open_cells = (self.grids != WALL) & (self.grids != PERSON)
+        open_cells[:, 1, 1] = True
+        distances = np.full(self.grids.shape, UNREACHABLE, dtype=np.int64)
+        distances[:, 1, 1] = 0
+        while True:
+            nearest = np.full(distances.shape, UNREACHABLE, dtype=np.int64)
+            nearest[:, 1:, :] = np.minimum(nearest[:, 1:, :], distances[:, :-1, :])
+            nearest[:, :-1, :] = np.minimum(nearest[:, :-1, :], distances[:, 1:, :])
+            nearest[:, :, 1:] = np.minimum(nearest[:, :, 1:], distances[:, :, :-1])
+            nearest[:, :, :-1] = np.minimum(nearest[:, :, :-1], distances[:, :, 1:])
+            relaxed = np.where(open_cells, np.minimum(distances, nearest + 1), UNREACHABLE)
+            if (relaxed == distances).all():
+                return distances
+            distances = relaxed
+
+    def way_home(self, distances):
+        # an action code per room taking its bot a move nearer base, like roomarea.way_home: towards the
+        # neighbours nearest home, forward if it's facing one, else the turn that faces one soonest. Where
+        # people cut the bot off it heads straight for base
+        xs = self.positions[:, 0, None] + 1 + DX[None, :]
+        ys = self.positions[:, 1, None] + 1 + DY[None, :]
+        around = distances[self.rows[:, None], xs, ys]
+        best = around.min(axis=1, keepdims=True)
+        wanted = (around == best) & (best < UNREACHABLE)
+        # the crow flies left or up first (base is up and to the left of everywhere), as step_towards
+        straight = np.zeros_like(wanted)
+        straight[:, LEFT] = self.positions[:, 0] > 0
+        straight[:, UP] = self.positions[:, 1] > 0
+        wanted = np.where(wanted.any(axis=1, keepdims=True), wanted, straight)
+        forward = wanted[self.rows, self.headings]
+        right = wanted[self.rows, (self.headings + 1) % 4]
+        return np.where(forward, ACTION_CODES['moveforward'],
+                        np.where(right, ACTION_CODES['turnright'], ACTION_CODES['turnleft']))
+
+    def step(self, actions):
+        # applies one action code per room, rooms that are done ignore theirs
+        actions = np.where(self.done, 0, actions)
+        self.steps += ~self.done
+        xs = self.positions[:, 0] + 1
+        ys = self.positions[:, 1] + 1
+        for action, class_id in ((ACTION_CODES['CleanChair'], CHAIR), (ACTION_CODES['CleanTrolley'], TROLLEY)):
+            cleaning = (actions == action) & (self.grids[self.rows, xs, ys] == class_id)
+            self.grids[self.rows[cleaning], xs[cleaning], ys[cleaning]] = 0
+            self.liquid[cleaning] -= 1
+            self.cleaned[cleaning] += 1
+
+        for primitive in PROGRAMS[actions, self.headings].T:
+            self.headings = (self.headings + TURNS[primitive]) % 4
+            forward = primitive == FORWARD
+            xs = self.positions[:, 0] + DX[self.headings]
+            ys = self.positions[:, 1] + DY[self.headings]
+            moving = forward & (self.grids[self.rows, xs + 1, ys + 1] != WALL)
+            self.positions[moving, 0] = xs[moving]
+            self.positions[moving, 1] = ys[moving]
+        self.retire()
+
+    def retire(self):
+        # a bot with no liquid left back at base is finished, as in roomarea.step
+        self.done |= (self.liquid <= 0) & (self.positions == 0).all(axis=1)
+
+    def run(self, program, steps=1000):
+        # program takes the batch and returns an action code per room
+        for step in range(steps):
+            if self.done.all():
+                break
+            self.step(program(self))
+        return self
+
+
+class BatchProgram:
+    # CleanProgram's random (non-optimal) mode for every room at once: clean what's underfoot, turn
+    # randomly at walls, go over to anything seen next door and come back, otherwise wander, and once out
+    # of liquid go home
+    def __init__(self, rooms, rng=None):
+        self.rng = np.random.default_rng(rng)
+        # the return move still owed after going over to clean a neighbour, 0 when there isn't one
+        self.pending = np.zeros(rooms, dtype=np.int64)
+        # batch.distances_home(), worked out the first time a bot runs dry (people don't move in a batch)
+        self.home = None
+
+    def __call__(self, batch):
+        view = batch.percepts()
+        here = view[:, 1, 1]
+        rooms = len(here)
+        choice = self.rng.integers(1, 9, size=rooms)
+        actions = np.where(choice == 1, ACTION_CODES['turnright'],
+                           np.where(choice == 2, ACTION_CODES['turnleft'], ACTION_CODES['moveforward']))
+
+        neighbours = view[:, NEIGHBOUR_X, NEIGHBOUR_Y]
+        dirty = (neighbours == CHAIR) | (neighbours == TROLLEY)
+        first = dirty.argmax(axis=1)
+        start = (self.pending == 0) & dirty.any(axis=1)
+        owed = self.pending != 0
+        actions = np.where(start, GO_CLEAN[first], np.where(owed, self.pending, actions))
+
+        bumped = batch.bumps()
+        turn = np.where(self.rng.integers(1, 3, size=rooms) == 1,
+                        ACTION_CODES['turnright'], ACTION_CODES['turnleft'])
+        actions = np.where(bumped, turn, actions)
+        actions = np.where(here == CHAIR, ACTION_CODES['CleanChair'], actions)
+        actions = np.where(here == TROLLEY, ACTION_CODES['CleanTrolley'], actions)
+
+        # the pending move is only used up (or set) when it was what the bot actually did
+        acted = (here != CHAIR) & (here != TROLLEY) & ~bumped
+        self.pending = np.where(acted & start, COME_BACK[first], np.where(acted & owed, 0, self.pending))
+
+        # bots out of liquid only head home
+        empty = batch.liquid <= 0
+        if empty.any():
+            if self.home is None:
+                self.home = batch.distances_home()
+            actions = np.where(empty, batch.way_home(self.home), actions)
+        return actions
@@ -0,0 +1,350 @@
+import collections
+import numbers
+from time import sleep, monotonic
+
+import numpy as np
+
+from .agents import Agent
+from .rng import RandomStream
+from .things import CLASS_IDS, Chair, Person, Thing, Trolley
+
+
+# what a run hands back: how many steps were taken, how many objects got cleaned, where the (first) agent
+# finished and why the run stopped
+RunResult = collections.namedtuple('RunResult', ['steps', 'cleaned', 'location', 'reason'])
+
+
+class Snapshot(collections.namedtuple('Snapshot', ['grid', 'class_names'])):
+    # a read-only copy of a room's class-id grid, which a renderer on another thread can draw from while
+    # the room keeps stepping. It has the same class_id_grid/class_names a room has, so exporters take either
+
+    def class_id_grid(self):
+        return self.grid
+
+# Setting up environment
+class Environment():
+    def __init__(self, width, height, boundary=True, color={}, display=False, array_world=False, stop_when=(),
+                 seed=None):
+        # things and agents are dicts used as ordered sets so membership checks and removal are O(1)
+        self.things = {}
+        self.agents = {}
+        # cell index: location -> things at that cell, kept up to date by add_thing, delete_thing
+        # and move_thing so lookups don't have to scan every thing in the room
+        self.cells = {}
+        # typed registries: class -> (location -> things of that class) plus how many of each remain,
+        # so finding a chair to clean or counting the trolleys left doesn't need an isinstance filter
+        self.registries = {tclass: {} for tclass in (Chair, Trolley, Person, Agent)}
+        self.counts = {tclass: 0 for tclass in self.registries}
+        # optional array-backed world: occupancy[x, y] holds the class id of the top thing at that cell
+        # (the cell index above is the sparse side table with the actual objects). Only drawing, frame export
+        # and seeding distance fields read it, percepts and coverage go through the cell index
+        self.class_ids = dict(CLASS_IDS)
+        self.class_names = {class_id: name for name, class_id in self.class_ids.items()}
+        self.occupancy = np.zeros((width, height), dtype=np.uint8) if array_world else None
+
+        self.done = 1
+        # counters the stopping conditions read (see termination.py), all kept up to date as things happen
+        # so deciding whether a run is over never has to scan the room
+        self.steps = 0
+        self.alive_agents = 0
+        # objects cleaned so far, environments whose agents clean things count them up
+        self.cleaned = 0
+        # cells the agents have sensed, environments that know what their agents can see count them up
+        self.covered = 0
+        # extra conditions that end a run as soon as any of them holds, e.g. [AllCleaned(), StepBudget(500)]
+        self.stop_when = list(stop_when)
+        self.stopped_by = None
+        # the room's own random numbers (layouts, exogenous changes), see rng.py
+        self.rng = RandomStream(seed)
+        self.width = width
+        self.height = height
+        self.observers = []
+        # Sets iteration start and end (no walls).
+        self.x_start, self.y_start = (0, 0)
+        self.x_end, self.y_end = (self.width, self.height)
+
+        # the block grid (and with it ipythonblocks/IPython) is only created once something is drawn,
+        # so headless runs never import the notebook display stack
+        self.grid = None
+        # cells whose contents changed since the last draw, the first draw paints everything
+        self.dirty = set()
+        self.redraw_all = True
+        if display:
+            self.get_grid().show()
+            self.visible = True
+        else:
+            self.visible = False
+        self.bounded = boundary
+        self.colors = color
+
+    def exogenous_change(self):
+        pass
+
+    def is_done(self):
+        # ends when condition is met. The stop conditions are checked first, so one that holds because the
+        # bots have finished (every bot home empty, say) is still the reason the run ended
+        for condition in self.stop_when:
+            if condition(self):
+                self.stopped_by = condition.name
+                return True
+        return self.done == 0 or self.alive_agents == 0
+
+    def stop_reason(self):
+        if not self.is_done():
+            return 'step limit'
+        if self.stopped_by is not None:
+            return self.stopped_by
+        if self.done == 0:
+            return 'finished'
+        if self.alive_agents == 0:
+            return 'no agents alive'
+        return self.stopped_by
+
+    def step(self):
+        if not self.is_done():
+            actions = []
+            for agent in self.agents:
+                if agent.alive:
+                    actions.append(agent.program(self.percept(agent)))
+                else:
+                    actions.append("")
+            for (agent, action) in zip(self.agents, actions):
+                self.execute_action(agent, action)
+            self.exogenous_change()
+            self.steps += 1
+
+    def run(self, steps=1000, delay=1, headless=False, fps=None, render_every=None, exporter=None, renderer=None):
+        # a headless run never draws or sleeps, it just steps as fast as it can.
+        # fps and render_every take drawing off the per-step path: the simulation keeps stepping
+        # (without sleeping) and the grid is only redrawn when a frame is due.
+        # frames also go to the exporter when one is given (see FrameExporter), headless or not.
+        # with a renderer (see ThreadedRenderer) frames are handed over as snapshots and drawn on
+        # another thread, so stepping never waits on the display
+        every_step = fps is None and render_every is None
+        if not every_step or renderer is not None:
+            delay = 0
+        next_frame = monotonic()
+        taken = 0
+        for step in range(steps):
+            if every_step or (render_every is not None and step % render_every == 0) or \
+                    (fps is not None and monotonic() >= next_frame):
+                self.show_frame(delay, headless, exporter, renderer)
+                if fps is not None:
+                    next_frame = monotonic() + 1 / fps
+            if self.is_done():
+                break
+            self.step()
+            taken += 1
+        self.show_frame(delay, headless, exporter, renderer)
+        return self.run_result(taken)
+
+    def show_frame(self, delay, headless, exporter, renderer=None):
+        if exporter is not None:
+            exporter.write(self)
+        if renderer is not None:
+            renderer.publish(self.snapshot())
+        elif not headless:
+            self.update(delay)
+
+    def snapshot(self):
+        grid = self.class_id_grid().copy()
+        grid.flags.writeable = False
+        return Snapshot(grid, dict(self.class_names))
+
+    def run_result(self, steps):
+        agent = next(iter(self.agents), None)
+        location = tuple(agent.location) if agent is not None else None
+        return RunResult(steps, self.cleaned, location, self.stop_reason())
+
+    def update(self, delay=1):
+        sleep(delay)
+        self.reveal()
+
+    def reveal(self):
+        from IPython.display import clear_output
+
+        self.draw_world()
+        # wait for the world to update and
+        # apply changes to the same grid instead
+        # of making a new one.
+        clear_output(wait=True)
+        self.grid.show()
+        self.visible = True
+
+    def get_grid(self):
+        if self.grid is None:
+            from ipythonblocks import BlockGrid
+
+            self.grid = BlockGrid(self.width, self.height, fill=(200, 200, 200))
+        return self.grid
+
+    def draw_world(self):
+        grid = self.get_grid()
+        if not self.redraw_all:
+            # only the cells that changed since the last frame get repainted
+            for key in self.dirty:
+                self.draw_cell(key)
+            self.dirty.clear()
+            return
+        grid[:] = (200, 200, 200)
+        self.redraw_all = False
+        self.dirty.clear()
+        if self.occupancy is not None:
+            # only the occupied cells need painting
+            for x, y in np.argwhere(self.occupancy).tolist():
+                grid[y, x] = self.colors[self.class_names[self.occupancy[x, y]]]
+            return
+        world = self.get_world()
+        for x in range(0, len(world)):
+            for y in range(0, len(world[x])):
+                if len(world[x][y]):
+                    grid[y, x] = self.colors[world[x][y][-1].__class__.__name__]
+
+    def draw_cell(self, key):
+        if isinstance(key, numbers.Number):
+            return
+        x, y = key
+        if 0 <= x < self.width and 0 <= y < self.height:
+            things = self.cells.get(key)
+            self.grid[y, x] = self.colors[things[-1].__class__.__name__] if things else (200, 200, 200)
+
+    def class_id(self, thing):
+        name = thing.__class__.__name__
+        if name not in self.class_ids:
+            self.class_ids[name] = len(self.class_ids) + 1
+            self.class_names[self.class_ids[name]] = name
+        return self.class_ids[name]
+
+    def class_id_grid(self):
+        # the class id of the top thing at every cell, read from the array world when there is one
+        if self.occupancy is not None:
+            return self.occupancy
+        grid = np.zeros((self.width, self.height), dtype=np.uint8)
+        for (x, y), things in self.cells.items():
+            if 0 <= x < self.width and 0 <= y < self.height:
+                grid[x, y] = self.class_id(things[-1])
+        return grid
+
+    def refresh_cell(self, key):
+        # keeps the array world in step after the things at a cell change
+        if self.occupancy is None or isinstance(key, numbers.Number):
+            return
+        x, y = key
+        if 0 <= x < self.width and 0 <= y < self.height:
+            things = self.cells.get(key)
+            self.occupancy[x, y] = self.class_id(things[-1]) if things else 0
+
+    def cell_key(self, location):
+        # locations can be lists or tuples (or plain numbers for 1d rooms), the index is keyed by tuples
+        if isinstance(location, numbers.Number):
+            return location
+        return tuple(location)
+
+    def list_things_at(self, location, tclass=Thing):
+        # gives all objects at the chosen location
+        key = self.cell_key(location)
+        if tclass in self.registries:
+            return list(self.registries[tclass].get(key, ()))
+        return [thing for thing in self.cells.get(key, ())
+                if isinstance(thing, tclass)]
+
+    def count_things(self, tclass):
+        # how many things of a registered class are left in the room
+        return self.counts[tclass]
+
+    def add_thing(self, thing, location=None):
+        # adds objects to the room
+        if not isinstance(thing, Thing):
+            thing = Agent(thing)
+        if thing in self.things:
+            print("Can't add the same thing twice")
+        else:
+            thing.location = location if location is not None else self.default_location(thing)
+            thing.environment = self
+            self.things[thing] = None
+            self.index_thing(thing)
+            for tclass in self.registries:
+                if isinstance(thing, tclass):
+                    self.counts[tclass] += 1
+            if isinstance(thing, Agent):
+                thing.performance = 0
+                self.agents[thing] = None
+                if thing.alive:
+                    self.alive_agents += 1
+
+    def add_things(self, tclass, locations):
+        # bulk add_thing: a new tclass at each of the locations, e.g. a whole generated layout. The class
+        # checks are done once for the batch instead of once per thing
+        if issubclass(tclass, Agent):
+            for location in locations:
+                self.add_thing(tclass(), location)
+            return
+        registries = [registry for registered, registry in self.registries.items() if issubclass(tclass, registered)]
+        for location in locations:
+            thing = tclass()
+            thing.location = location
+            thing.environment = self
+            self.things[thing] = None
+            self.index_thing(thing, registries)
+        for registered in self.registries:
+            if issubclass(tclass, registered):
+                self.counts[registered] += len(locations)
+
+    def delete_thing(self, thing):
+        # deletes objects from the room
+        try:
+            del self.things[thing]
+        except KeyError:
+            print("  in Environment delete_thing")
+            print("  Thing to be removed: {} at {}".format(thing, thing.location))
+            print("  from list: {}".format([(thing, thing.location) for thing in self.things]))
+            return
+        self.unindex_thing(thing)
+        for tclass in self.registries:
+            if isinstance(thing, tclass):
+                self.counts[tclass] -= 1
+        if thing in self.agents:
+            del self.agents[thing]
+            if thing.alive:
+                self.alive_agents -= 1
+        thing.environment = None
+
+    def move_thing(self, thing, location):
+        # moves an object to a new location and keeps the cell index in step with it
+        self.unindex_thing(thing)
+        thing.location = location
+        self.index_thing(thing)
+
+    def index_thing(self, thing, registries=None):
+        # registries are the ones thing belongs in, worked out here unless the caller already knows them
+        # (add_things does once for a whole batch of one class)
+        if registries is None:
+            registries = [registry for tclass, registry in self.registries.items() if isinstance(thing, tclass)]
+        key = self.cell_key(thing.location)
+        self.cells.setdefault(key, []).append(thing)
+        for registry in registries:
+            registry.setdefault(key, []).append(thing)
+        self.refresh_cell(key)
+        self.dirty.add(key)
+        self.cell_changed(key, thing)
+
+    def unindex_thing(self, thing):
+        key = self.cell_key(thing.location)
+        self.remove_from_cell(self.cells, key, thing)
+        for tclass, registry in self.registries.items():
+            if isinstance(thing, tclass):
+                self.remove_from_cell(registry, key, thing)
+        self.refresh_cell(key)
+        self.dirty.add(key)
+        self.cell_changed(key, thing)
+
+    def cell_changed(self, key, thing):
+        # called whenever thing arrives at or leaves the cell at key, for subclasses that cache what's where
+        pass
+
+    @staticmethod
+    def remove_from_cell(index, key, thing):
+        cell = index[key]
+        cell.remove(thing)
+        if not cell:
+            del index[key]
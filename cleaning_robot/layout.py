@@ -0,0 +1,65 @@
+# Building rooms to run: a random size room with chairs, trolleys and a person placed at random, and a
+# bot at (0, 0) with enough liquid to clean everything.
+import numpy as np
+
+from .agents import CleanBot
+from .programs import program
+from .rng import RandomStream, spawn_seeds
+from .room import roomarea
+from .things import Chair, Person, Trolley
+
+COLORS = {'CleanBot': (255, 0, 0), 'Chair': (0, 255, 0), 'Person': (2, 2, 2), 'Trolley': (0, 0, 255)}
+
+
+def random_room_size(rng=None):
+    # a random size for the room within a changable range, then a random number of objects less than the
+    # length of one side of the room, then how many of those are trolleys (the rest are chairs)
+    rng = rng or RandomStream()
+    n = rng.randint(3, 20)
+    m = rng.randint(2, n - 1)
+    mm = rng.randint(1, m)
+    return n, m, mm
+
+
+def make_room(n, m, mm, optimal=True, color=COLORS, seed=None, capacity=None, program=program, **kwargs):
+    # an n x n room with m - mm chairs, mm trolleys and one person, and a bot that can clean m times.
+    # with a capacity the bot's tank only holds that much and it refills at base instead (see CleanBot).
+    # the room and the bot get their own random streams spawned from seed.
+    # extra keyword arguments go to roomarea
+    width = n
+    height = n
+    room_seed, bot_seed = spawn_seeds(seed, 2)
+    room = roomarea(width=n, height=n, color=color, seed=room_seed, **kwargs)
+    bot = CleanBot(program, optimal=optimal, seed=bot_seed, refill=capacity is not None)
+    # this sets the number of times the bot can clean before returning to the number of items placed
+    bot.addLiquid(m if capacity is None else capacity)
+    room.add_thing(bot, [0, 0])
+    # everything else goes anywhere but the bot's starting cell
+    layout = generate_layout(width, height, {Chair: m - mm, Person: 1, Trolley: mm}, room.rng, reserved=[(0, 0)])
+    for tclass, locations in layout.items():
+        room.add_things(tclass, locations)
+    return room, bot
+
+
+def generate_layout(width, height, counts, rng, reserved=()):
+    # places counts[tclass] things of each class on distinct random cells, none of them on a reserved cell.
+    # All the cells are drawn in one go by sampling flat cell indices without replacement, so there are no
+    # rejected draws however full the room gets, and huge rooms cost no more than the things placed in them.
+    # Returns tclass -> list of [x, y]
+    total = sum(counts.values())
+    reserved = sorted({x * height + y for x, y in reserved})
+    free = width * height - len(reserved)
+    if total > free:
+        raise ValueError("{} things don't fit in the {} free cells of a {}x{} room".format(total, free, width, height))
+    generator = getattr(rng, 'generator', rng)
+    cells = generator.choice(free, size=total, replace=False)
+    # step over the reserved cells: going up from the lowest, everything at or past one moves along by one
+    for cell in reserved:
+        cells += cells >= cell
+    locations = np.stack([cells // height, cells % height], axis=1).tolist()
+    layout = {}
+    start = 0
+    for tclass, count in counts.items():
+        layout[tclass] = locations[start:start + count]
+        start += count
+    return layout
@@ -0,0 +1,127 @@
+# Monte Carlo runs: thousands of seeded headless trials fanned out over a process pool, with results
+# streamed back as they finish and summed up per (room size, objects, strategy).
+#
+#   python -m cleaning_robot.montecarlo --trials 10000
+import argparse
+import collections
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import numpy as np
+
+from .layout import make_room
+from .programs import OracleProgram, TripProgram, program
+from .rng import RandomStream
+
+# a trial is one room: the root seed and its index under it, size n, m objects of which mm are trolleys,
+# the bot's strategy, its tank size when it refills at base (None for a tank that holds everything) and how
+# often the person in the room takes a random step
+Trial = collections.namedtuple('Trial', ['seed', 'index', 'n', 'm', 'mm', 'strategy', 'capacity', 'people_move'],
+                               defaults=(None, 0.0))
+TrialResult = collections.namedtuple('TrialResult', ['trial', 'steps', 'cleaned', 'liquid_left', 'path_length',
+                                                     'reason'])
+
+# optimal sweeps the room, random wanders, trips knows the layout and plans its trips (see TripProgram),
+# oracle knows it too and plays back a tour planned ahead, the baseline the others are measured against
+STRATEGIES = ('optimal', 'random', 'trips', 'oracle')
+PROGRAMS = {'optimal': program, 'random': program, 'trips': TripProgram, 'oracle': OracleProgram}
+
+
+def sample_trials(count, seed=0, strategies=STRATEGIES, capacity=None, people_move=0.0):
+    # count rooms drawn the way the script draws them, each run once per strategy (on the same layout)
+    rng = RandomStream(seed)
+    for index in range(count):
+        n = rng.randint(3, 20)
+        m = rng.randint(2, n - 1)
+        mm = rng.randint(1, m)
+        for strategy in strategies:
+            yield Trial(seed, index, n, m, mm, strategy, capacity, people_move)
+
+
+def trial_seed(trial):
+    # trial i's streams are the i-th child of the root seed, the same child SeedSequence.spawn would hand
+    # out, so no two trials share random numbers and any worker can rebuild them from the trial alone
+    return np.random.SeedSequence(trial.seed, spawn_key=(trial.index,))
+
+
+def run_trial(trial, steps=5000):
+    room, bot = make_room(trial.n, trial.m, trial.mm, optimal=trial.strategy == 'optimal',
+                          seed=trial_seed(trial), capacity=trial.capacity, program=PROGRAMS[trial.strategy],
+                          people_move=trial.people_move)
+    result = room.run(steps, headless=True)
+    return TrialResult(trial, result.steps, result.cleaned, bot.cleaningliquid, bot.path.total - 1, result.reason)
+
+
+def run_chunk(trials, steps=5000):
+    return [run_trial(trial, steps) for trial in trials]
+
+
+def run_trials(trials, workers=None, chunksize=16, steps=5000):
+    # yields results in the order they finish. Trials are handed out in chunks so the pool spends its
+    # time simulating rather than pickling; workers defaults to every core
+    with ProcessPoolExecutor(max_workers=workers or os.cpu_count()) as pool:
+        futures = []
+        chunk = []
+        for trial in trials:
+            chunk.append(trial)
+            if len(chunk) == chunksize:
+                futures.append(pool.submit(run_chunk, chunk, steps))
+                chunk = []
+        if chunk:
+            futures.append(pool.submit(run_chunk, chunk, steps))
+        for future in as_completed(futures):
+            yield from future.result()
+
+
+Summary = collections.namedtuple('Summary', ['trials', 'steps', 'cleaned', 'liquid_left', 'path_length',
+                                             'finished'])
+
+
+class Aggregate:
+    # running totals per (n, m, strategy), so results can be folded in as they stream back
+    def __init__(self):
+        self.totals = collections.defaultdict(lambda: [0, 0, 0, 0, 0, 0])
+
+    def add(self, result):
+        trial = result.trial
+        totals = self.totals[(trial.n, trial.m, trial.strategy)]
+        totals[0] += 1
+        totals[1] += result.steps
+        totals[2] += result.cleaned
+        totals[3] += result.liquid_left
+        totals[4] += result.path_length
+        totals[5] += result.reason != 'step limit'
+
+    def summary(self):
+        # (n, m, strategy) -> Summary of means, finished is the fraction of trials that ended on their own
+        return {key: Summary(totals[0], *(total / totals[0] for total in totals[1:]))
+                for key, totals in sorted(self.totals.items())}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Monte Carlo runs of the cleaning bot")
+    parser.add_argument('--trials', type=int, default=1000, help="rooms to draw (each run once per strategy)")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--workers', type=int, default=None, help="processes to use, every core by default")
+    parser.add_argument('--steps', type=int, default=5000, help="step limit per trial")
+    parser.add_argument('--strategy', action='append', choices=STRATEGIES, help="can be given more than once")
+    parser.add_argument('--capacity', type=int, default=None,
+                        help="how much the bot's tank holds, it refills at base between trips")
+    parser.add_argument('--people-move', type=float, default=0.0,
+                        help="chance each step that the person in the room takes a random step")
+    args = parser.parse_args(argv)
+
+    aggregate = Aggregate()
+    trials = sample_trials(args.trials, args.seed, args.strategy or STRATEGIES, args.capacity, args.people_move)
+    for result in run_trials(trials, args.workers, steps=args.steps):
+        aggregate.add(result)
+    print("{:>3} {:>3} {:>8} {:>6} {:>8} {:>8} {:>6} {:>6} {:>8}".format(
+        'n', 'm', 'strategy', 'trials', 'steps', 'cleaned', 'liquid', 'path', 'finished'))
+    for (n, m, strategy), summary in aggregate.summary().items():
+        print("{:>3} {:>3} {:>8} {:>6} {:>8.1f} {:>8.2f} {:>6.2f} {:>6.1f} {:>8.2f}".format(
+            n, m, strategy, summary.trials, summary.steps, summary.cleaned, summary.liquid_left,
+            summary.path_length, summary.finished))
+
+
+if __name__ == '__main__':
+    main()
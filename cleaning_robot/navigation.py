@@ -0,0 +1,263 @@
+# Getting around a room with people in it. A DistanceField holds how many moves every cell is from a
+# target going round blocked cells (people), found once by breadth first search and patched in place when
+# a cell is blocked or freed, so a bot asking for the way every step only ever reads it. Like D* Lite the
+# field is rooted at the target, so a bot that moves keeps using it and only people moving cost anything,
+# and like D* Lite it only patches what the bot needs: people's moves wait in a queue by how near the
+# target they could change things, and a bot deciding its next step only has the ones patched in that
+# could change the cells next to it. Someone wandering about further away than the bot is never looked
+# at, and a field nobody is following costs nothing.
+import collections
+import heapq
+
+import numpy as np
+
+from .agents import Direction
+
+UNREACHABLE = float('inf')
+# how DistanceField marks cells the target can't be reached from, in its int32 array
+FAR = int(np.iinfo(np.int32).max)
+
+
+def steer(heading, wanted):
+    # the action that gets a bot facing heading (a Direction code) going one of the wanted headings:
+    # forward if it's already facing one, otherwise the turn that gets it facing one soonest
+    if heading in wanted:
+        return 'moveforward'
+    if any((want - heading) % 4 == Direction.R for want in wanted):
+        return 'turnright'
+    return 'turnleft'
+
+
+def walk(location, heading, target):
+    # the primitive actions that take a bot at location facing heading to target with nothing in the way,
+    # along one axis and then the other (the one it's already facing along first), and the heading it
+    # ends up with
+    x, y = location
+    tx, ty = target
+    legs = [(Direction.R if tx > x else Direction.L, abs(tx - x)),
+            (Direction.D if ty > y else Direction.U, abs(ty - y))]
+    if legs[1][1] and legs[1][0] == heading:
+        legs.reverse()
+    actions = []
+    for want, moves in legs:
+        if not moves:
+            continue
+        turn = (want - heading) % 4
+        if turn == Direction.R:
+            actions.append('turnright')
+        elif turn:
+            actions.extend(['turnleft'] * (4 - turn))
+        actions.extend(['moveforward'] * moves)
+        heading = want
+    return actions, heading
+
+
+class DistanceField:
+    # distances and blocked are flat arrays over the room's cells, cell (x, y) at x * height + y (the order
+    # an [x, y] grid is laid out in), distances holding FAR for cells the target can't be reached from.
+    # blocked can be given as a (width, height) boolean grid or as a list of cells
+    def __init__(self, width, height, blocked=(), target=(0, 0)):
+        self.width = width
+        self.height = height
+        self.target = tuple(target)
+        self.blocked = np.zeros(width * height, dtype=bool)
+        if isinstance(blocked, np.ndarray):
+            self.blocked[:] = blocked.reshape(-1)
+        else:
+            for x, y in blocked:
+                if 0 <= x < width and 0 <= y < height:
+                    self.blocked[x * height + y] = True
+        # the target is never blocked, whoever is standing on it
+        self.start = self.index(self.target)
+        self.blocked[self.start] = False
+        self.distances = np.full(width * height, FAR, dtype=np.int32)
+        # the same two arrays read and written a cell at a time while patching, as plain ints and bools
+        # (indexing the arrays themselves one element at a time is much slower)
+        self.moves = memoryview(self.distances)
+        self.walls = memoryview(self.blocked)
+        # cell -> whether it's blocked now, for changes not patched in yet, and a heap of (how near the
+        # target the change could make a difference, cell) over them
+        self.pending = {}
+        self.queue = []
+        self.search()
+
+    def index(self, cell):
+        x, y = cell
+        return x * self.height + y
+
+    def distance(self, cell):
+        if self.queue:
+            self.settle()
+        x, y = cell
+        if not (0 <= x < self.width and 0 <= y < self.height):
+            return UNREACHABLE
+        moves = self.moves[x * self.height + y]
+        return UNREACHABLE if moves == FAR else moves
+
+    def adjacent(self, cell):
+        # the cells next to cell inside the room (up, right, down, left), worked out from its index
+        height = self.height
+        y = cell % height
+        cells = []
+        if y > 0:
+            cells.append(cell - 1)
+        if cell + height < len(self.moves):
+            cells.append(cell + height)
+        if y < height - 1:
+            cells.append(cell + 1)
+        if cell >= height:
+            cells.append(cell - height)
+        return cells
+
+    def neighbours(self, cell):
+        walls = self.walls
+        return [neighbour for neighbour in self.adjacent(cell) if not walls[neighbour]]
+
+    def search(self):
+        # the whole field from scratch: breadth first a level at a time, each level's cells found together
+        # from the one before's, O(width * height)
+        height = self.height
+        size = len(self.distances)
+        distances = self.distances
+        distances[:] = FAR
+        distances[self.start] = 0
+        open_cells = ~self.blocked
+        frontier = np.array([self.start], dtype=np.int64)
+        step = 0
+        while frontier.size:
+            step += 1
+            y = frontier % height
+            reached = np.concatenate((frontier[y > 0] - 1, frontier[frontier + height < size] + height,
+                                      frontier[y < height - 1] + 1, frontier[frontier >= height] - height))
+            reached = reached[open_cells[reached] & (distances[reached] == FAR)]
+            frontier = np.unique(reached)
+            distances[frontier] = step
+
+    def set_blocked(self, cell, blocked):
+        cell = self.index(cell)
+        if cell == self.start:
+            return
+        if blocked == self.walls[cell]:
+            # back as the field has it (someone walked through), nothing to patch
+            self.pending.pop(cell, None)
+            return
+        self.pending[cell] = blocked
+        heapq.heappush(self.queue, (self.reach(cell), cell))
+
+    def nearest(self, cell):
+        # the fewest moves to the target from any open cell next to cell, FAR if none can reach it
+        moves = self.moves
+        return min((moves[neighbour] for neighbour in self.neighbours(cell)), default=FAR)
+
+    def reach(self, cell):
+        # the nearest distance a change at cell could alter: blocking a cell only pushes back the cells
+        # that went through it, which are all further away than it, and freeing one only brings in cells
+        # further away than its new distance
+        if self.walls[cell]:
+            best = self.nearest(cell)
+            return FAR if best == FAR else best + 1
+        return self.moves[cell]
+
+    def settle(self, upto=FAR):
+        # patches in the changes that could alter a distance of upto or less. Every cell the field has at
+        # upto or less is right after this, whatever is still waiting
+        queue = self.queue
+        pending = self.pending
+        while queue and queue[0][0] <= upto:
+            reach, cell = heapq.heappop(queue)
+            if cell not in pending:
+                continue
+            # patching other cells since may have moved it further off
+            now = self.reach(cell)
+            if upto < now != FAR:
+                heapq.heappush(queue, (now, cell))
+                continue
+            if pending.pop(cell):
+                self.block(cell)
+            else:
+                self.unblock(cell)
+
+    def nearer(self, cell):
+        # cell has come nearer the target: a change waiting at it or next to it may matter sooner than queued
+        for neighbour in [cell] + self.adjacent(cell):
+            if neighbour in self.pending:
+                heapq.heappush(self.queue, (self.reach(neighbour), neighbour))
+
+    def unblock(self, cell):
+        # a freed cell can only make things shorter: give it a distance from its neighbours and spread any
+        # improvement outwards
+        self.walls[cell] = False
+        moves = self.moves
+        best = self.nearest(cell)
+        if best == FAR:
+            return
+        moves[cell] = best + 1
+        queue = collections.deque([cell])
+        while queue:
+            current = queue.popleft()
+            if self.pending:
+                self.nearer(current)
+            step = moves[current] + 1
+            for neighbour in self.neighbours(current):
+                if moves[neighbour] > step:
+                    moves[neighbour] = step
+                    queue.append(neighbour)
+
+    def block(self, cell):
+        # only cells whose every shortest way went through the blocked one get further away. Those are
+        # found level by level outwards from it (a cell is cut off once none of its neighbours one move
+        # nearer is left), then given new distances from the cells around them that weren't
+        self.walls[cell] = True
+        moves = self.moves
+        if moves[cell] == FAR:
+            return
+        cut = {cell: moves[cell]}
+        moves[cell] = FAR
+        queue = collections.deque([cell])
+        while queue:
+            current = queue.popleft()
+            step = cut[current] + 1
+            for neighbour in self.neighbours(current):
+                if moves[neighbour] != step or neighbour == self.start:
+                    continue
+                if any(moves[support] == step - 1 for support in self.neighbours(neighbour)):
+                    continue
+                cut[neighbour] = step
+                moves[neighbour] = FAR
+                queue.append(neighbour)
+
+        heap = []
+        for current in cut:
+            if current == cell:
+                continue
+            best = self.nearest(current)
+            if best != FAR:
+                heapq.heappush(heap, (best + 1, current))
+        while heap:
+            step, current = heapq.heappop(heap)
+            if moves[current] <= step:
+                continue
+            moves[current] = step
+            for neighbour in self.neighbours(current):
+                if moves[neighbour] > step + 1:
+                    heapq.heappush(heap, (step + 1, neighbour))
+
+    def step_from(self, location, heading):
+        # the action that takes a bot at location facing heading one move nearer the target, going round
+        # blocked cells. None when the target can't be reached from here (or the bot is on it)
+        x, y = location
+        moves = self.moves
+        around = [(x + dx) * self.height + y + dy if 0 <= x + dx < self.width and 0 <= y + dy < self.height
+                  else None for dx, dy in zip(Direction.DX, Direction.DY)]
+        inside = [cell for cell in around if cell is not None]
+        while True:
+            best = min((moves[cell] for cell in inside), default=FAR)
+            # only what could change the nearest cells round the bot has to be patched in first
+            if not self.queue or self.queue[0][0] > best:
+                break
+            self.settle(best)
+        wanted = [code for code, cell in enumerate(around)
+                  if cell is not None and best != FAR and moves[cell] == best]
+        if not wanted or (x, y) == self.target:
+            return None
+        return steer(heading, wanted)
@@ -0,0 +1,116 @@
+from array import array
+
+import numpy as np
+
+
+class Path:
+    # the trail of locations a bot has been to, kept as a flat array('i') of ints (8 bytes a point rather
+    # than a tuple per move) which grows geometrically as it fills.
+    # With rle a straight run of moves is one entry, start x, y, step dx, dy and how many points it covers,
+    # instead of an entry per point. With limit only the newest limit entries (points, or runs with rle)
+    # are kept and older ones are overwritten in place, so a bot that runs forever holds a bounded trail.
+    # to_array gives everything still held as one (points, 2) array
+    def __init__(self, limit=None, rle=False):
+        if limit is not None and limit < 1:
+            raise ValueError("a path has to hold at least one entry, got limit={}".format(limit))
+        self.limit = limit
+        self.rle = rle
+        self.width = 5 if rle else 2
+        self.data = array('i')
+        # the oldest entry, only moves once a limited path has filled up
+        self.start = 0
+        self.entries = 0
+        # points ever added, and how many of them have since been overwritten
+        self.total = 0
+        self.dropped = 0
+
+    def __len__(self):
+        return self.total - self.dropped
+
+    def __iter__(self):
+        for x, y in self.to_array().tolist():
+            yield x, y
+
+    def __getitem__(self, index):
+        if self.rle:
+            return self.find(index)
+        if index < 0:
+            index += self.entries
+        if not 0 <= index < self.entries:
+            raise IndexError("path index out of range")
+        i = self.slot(index)
+        return self.data[i], self.data[i + 1]
+
+    def __repr__(self):
+        return '<Path {} points held of {}>'.format(len(self), self.total)
+
+    def find(self, index):
+        # the index-th point of an rle path, decoding only the run it's in. Runs are walked from whichever
+        # end is nearer the point, so path[0] and path[-1] are quick, anything in the middle is O(runs)
+        length = len(self)
+        if index < 0:
+            index += length
+        if not 0 <= index < length:
+            raise IndexError("path index out of range")
+        data = self.data
+        if index < length // 2:
+            # from the oldest run on, start is where each run starts
+            start = 0
+            for entry in range(self.entries):
+                i = self.slot(entry)
+                if start + data[i + 4] > index:
+                    break
+                start += data[i + 4]
+        else:
+            # from the newest run back
+            start = length
+            for entry in range(self.entries - 1, -1, -1):
+                i = self.slot(entry)
+                start -= data[i + 4]
+                if start <= index:
+                    break
+        along = index - start
+        return data[i] + along * data[i + 2], data[i + 1] + along * data[i + 3]
+
+    def slot(self, index):
+        # where the index-th oldest entry starts in self.data
+        if self.limit is not None:
+            index = (self.start + index) % self.limit
+        return index * self.width
+
+    def append(self, location):
+        x, y = location
+        self.total += 1
+        data = self.data
+        if self.rle and self.entries:
+            i = self.slot(self.entries - 1)
+            x0, y0, dx, dy, count = data[i:i + 5]
+            # a run's second point sets its step, after that only points carrying on in a line join it
+            if count == 1:
+                data[i + 2] = x - x0
+                data[i + 3] = y - y0
+                data[i + 4] = 2
+                return
+            if x == x0 + count * dx and y == y0 + count * dy:
+                data[i + 4] = count + 1
+                return
+        entry = (x, y, 0, 0, 1) if self.rle else (x, y)
+        if self.entries == self.limit:
+            i = self.start * self.width
+            self.dropped += data[i + 4] if self.rle else 1
+            data[i:i + self.width] = array('i', entry)
+            self.start = (self.start + 1) % self.limit
+        else:
+            data.extend(entry)
+            self.entries += 1
+
+    def to_array(self):
+        entries = np.array(self.data, dtype=np.intc).reshape(-1, self.width)
+        entries = np.concatenate([entries[self.start:], entries[:self.start]])
+        if not self.rle:
+            return entries.astype(np.int64)
+        counts = entries[:, 4]
+        runs = np.repeat(np.arange(len(entries)), counts)
+        # how far along its run each point is
+        along = np.arange(len(runs)) - np.repeat(np.cumsum(counts) - counts, counts)
+        return (entries[runs, :2] + along[:, None] * entries[runs, 2:4]).astype(np.int64)
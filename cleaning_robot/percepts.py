@@ -0,0 +1,52 @@
+from .things import Chair, Person, Trolley
+
+# the eight cells around a bot in the order CleanProgram looks at them (up, down, left, right, then the
+# diagonals). Bit i of a percept's masks is the cell at NEIGHBOURS[i]
+NEIGHBOURS = ((0, -1), (0, 1), (-1, 0), (1, 0), (-1, -1), (1, -1), (-1, 1), (1, 1))
+NEIGHBOUR_BITS = tuple((dx, dy, 1 << bit) for bit, (dx, dy) in enumerate(NEIGHBOURS))
+
+
+class Percept:
+    # what a bot senses in one step. roomarea hands the same record to every bot standing in the same place
+    # facing the same way until something in view changes, so programs only read it.
+    # here is the first chair or trolley under the bot (None if there isn't one), bump is whether it's
+    # facing the wall, cleanable has a bit set for every neighbour with a chair or trolley in it and
+    # people one for every neighbour with a person in it
+    __slots__ = ('here', 'bump', 'cleanable', 'people')
+
+    def __init__(self):
+        self.here = None
+        self.bump = False
+        self.cleanable = 0
+        self.people = 0
+
+    def __repr__(self):
+        return '<Percept here={} bump={} cleanable={:08b} people={:08b}>'.format(
+            self.here, self.bump, self.cleanable, self.people)
+
+    def first_cleanable(self):
+        # index into NEIGHBOURS of the first neighbour with something to clean, -1 if there's none
+        return (self.cleanable & -self.cleanable).bit_length() - 1
+
+    def fill(self, env, location, heading):
+        x, y = location
+        here = None
+        for thing in env.cells.get((x, y), ()):
+            if isinstance(thing, (Chair, Trolley)):
+                here = thing
+                break
+        chairs = env.registries[Chair]
+        trolleys = env.registries[Trolley]
+        people = env.registries[Person]
+        cleanable = crowded = 0
+        for dx, dy, bit in NEIGHBOUR_BITS:
+            key = (x + dx, y + dy)
+            if key in chairs or key in trolleys:
+                cleanable |= bit
+            if key in people:
+                crowded |= bit
+        self.here = here
+        self.bump = not env.is_inbounds((x + heading.DX[heading.direction], y + heading.DY[heading.direction]))
+        self.cleanable = cleanable
+        self.people = crowded
+        return self
@@ -0,0 +1,198 @@
+import numpy as np
+
+from .navigation import FAR, DistanceField, walk
+from .routing import manhattan, plan_tour, plan_trips, split_tour
+from .sweep import plan_sweep, step_towards
+from .things import Chair, Trolley
+
+
+class CleanProgram:
+    # the cleaning program, bound to the bot it drives so every bot keeps its own state and any number of
+    # bots (and rooms) can run side by side. Agents given the class build their own instance, so
+    # CleanBot(CleanProgram) and CleanBot(program) both work
+
+    # for each neighbour in percepts.NEIGHBOURS, the clean action that goes over to it and the one back
+    ERRANDS = (('cleanup', 'cleandown'), ('cleandown', 'cleanup'), ('cleanleft', 'cleanright'),
+               ('cleanright', 'cleanleft'), ('cleanupleft', 'cleandownright'), ('cleanupright', 'cleandownleft'),
+               ('cleandownleft', 'cleanupright'), ('cleandownright', 'cleanupleft'))
+
+    def __init__(self, bot):
+        self.bot = bot
+        # the optimal bot's sweep, planned the first time it's needed, and the corner it's heading for
+        self.sweep = None
+        self.leg = 0
+
+    def __call__(self, percept):
+        bot = self.bot
+
+        # out of liquid (or in refill mode, with nothing left to clean): head back to base a move at a time,
+        # the shortest way round anyone in the way (straight there if people have it cut off). A refilled
+        # bot picks up its sweep where it left it
+        if bot.cleaningliquid <= 0 or (bot.refill and not bot.environment.left_to_clean()):
+            bot.needed_cleaning.clear()
+            return go_home(bot)
+
+        # this s used to check if what is on the agents currecnt location and tells it what to do
+        if percept.here is not None:
+            if isinstance(percept.here, Chair):
+                return 'CleanChair'
+            return 'CleanTrolley'
+        # the optimal bot never walks into a wall, it's always heading for a point of its sweep
+        if percept.bump and not bot.optimal:
+            choice = bot.rng.choice((1, 2))
+            if choice == 1:
+                return 'turnright'
+            elif choice == 2:
+                return 'turnleft'
+        # these are when the bot percepts an object nearby and can choose to appropriate way to get to it
+        # After percepting the areas around the bot, the bot will check if there is a trolley or chair, if there is it will use the
+        # action appropriate for where around the robot it is(ie. if it's to the top left it will use that action)
+        # then in the action it will check what direction the bot is facing and choose depending how it can efficiently move to the
+        # object
+        # ie. if it sees a chair to the bottom right and the bot's facing down, it will move down one, turn left so it's facing right
+        # then move forward again and clean
+
+
+
+        # the first neighbour (in NEIGHBOURS order) with a chair or trolley in it, the clean action that goes
+        # there and the one that comes back are queued up together
+        if len(bot.needed_cleaning) == 0 and percept.cleanable:
+            bot.needed_cleaning.extend(self.ERRANDS[percept.first_cleanable()])
+
+        if len(bot.needed_cleaning) > 0:
+            temp = bot.needed_cleaning.pop(0)
+            return temp
+
+        #if bot.needed_cleaning:
+        #    return bot.needed_cleaning.pop(0)
+
+        # the optimal bot follows the sweep worked out in sweep.py, heading for each of its corners in turn
+        # (and back onto it after going over to clean something). Something first seen while the bot was busy
+        # cleaning can be missed, so with the sweep done and liquid left it sweeps back the other way
+        if bot.optimal:
+            if self.sweep is None:
+                self.sweep = plan_sweep(bot.environment.width, bot.environment.height)
+            for attempt in range(2):
+                while self.leg < len(self.sweep):
+                    action = step_towards(bot.location, bot.direction.direction, self.sweep[self.leg])
+                    if action is not None:
+                        return action
+                    self.leg += 1
+                self.sweep.reverse()
+                self.leg = 0
+
+        # when not seeing anything this'll have the bot moving randomly with a higher chance or going forward if possible
+        choice = bot.rng.choice((1, 2, 3, 4, 5, 6, 7, 8))
+        if choice == 1:
+            return 'turnright'
+        elif choice == 2:
+            return 'turnleft'
+        else:
+            return 'moveforward'
+
+
+class TripProgram:
+    # a bot that knows where everything is from the start: it reads the room the first time it's asked,
+    # plans trips out from base with routing.plan_trips (as many things per trip as its tank holds) and
+    # goes round them the shortest way, heading home to refill after each. Give it a bot in refill mode
+    # when the tank can't hold everything
+    def __init__(self, bot):
+        self.bot = bot
+        # the cells still to go to in order, base between trips
+        self.stops = None
+
+    def plan(self):
+        room = self.bot.environment
+        things = list(room.registries[Chair]) + list(room.registries[Trolley])
+        people = room.people_grid()
+        # with nobody in the room the way between two stops is straight there
+        distance = distances_between(room, [(0, 0)] + things, people) if people.any() else manhattan
+        stops = []
+        for trip in plan_trips(things, self.bot.capacity, distance):
+            stops.extend(trip)
+            stops.append((0, 0))
+        return stops
+
+    def __call__(self, percept):
+        bot = self.bot
+        if self.stops is None:
+            self.stops = self.plan()
+        while self.stops:
+            target = self.stops[0]
+            if tuple(bot.location) == target:
+                if percept.here is not None and bot.cleaningliquid > 0:
+                    return 'CleanChair' if isinstance(percept.here, Chair) else 'CleanTrolley'
+                self.stops.pop(0)
+                # base's field is used every trip, a stop's isn't needed again
+                if target != (0, 0):
+                    bot.environment.forget_field(target)
+                continue
+            # out of liquid before the trip is done (it was started part full): top up first
+            if bot.cleaningliquid <= 0:
+                return go_home(bot)
+            return bot.environment.way_to(bot, target) or step_towards(bot.location, bot.direction.direction, target)
+        return go_home(bot)
+
+
+class OracleProgram:
+    # the baseline to hold the others up against: a bot that knows the whole layout and cleans it on a
+    # short tour (routing.plan_tour, cut into trips with refills at base in refill mode) worked out before
+    # it moves, then plays the tour back a primitive action a step. It walks straight through people
+    def __init__(self, bot):
+        self.bot = bot
+        self.actions = None
+        self.next = 0
+
+    def plan(self):
+        bot = self.bot
+        room = bot.environment
+        cleans = {location: 'CleanChair' for location in room.registries[Chair]}
+        cleans.update({location: 'CleanTrolley' for location in room.registries[Trolley]})
+        if bot.refill:
+            # one tour cut into trips, each trip then put in its own best order
+            trips = [plan_tour(trip) for trip in split_tour(plan_tour(cleans), bot.capacity)]
+        else:
+            trips = [plan_tour(cleans, budget=bot.cleaningliquid)]
+        actions = []
+        location = tuple(bot.location)
+        heading = bot.direction.direction
+        for trip in trips:
+            for stop in trip + [(0, 0)]:
+                moves, heading = walk(location, heading, stop)
+                actions.extend(moves)
+                if stop in cleans:
+                    actions.append(cleans[stop])
+                location = stop
+        return actions
+
+    def __call__(self, percept):
+        if self.actions is None:
+            self.actions = self.plan()
+        if self.next == len(self.actions):
+            return None
+        self.next += 1
+        return self.actions[self.next - 1]
+
+
+def distances_between(room, cells, people):
+    # distance(a, b) for any two of cells going round people, from a search out of each cell that's thrown
+    # away once the moves to the others are read off it. The room only keeps the fields bots are following,
+    # since each one has to keep up with people walking about
+    row = {cell: i for i, cell in enumerate(cells)}
+    flat = np.array([x * room.height + y for x, y in cells])
+    table = np.empty((len(cells), len(cells)), dtype=np.int32)
+    for i, cell in enumerate(cells):
+        table[i] = DistanceField(room.width, room.height, people, cell).distances[flat]
+
+    def distance(a, b):
+        moves = int(table[row[b], row[a]])
+        return manhattan(a, b) if moves == FAR else moves
+
+    return distance
+
+
+def go_home(bot):
+    return bot.environment.way_home(bot) or step_towards(bot.location, bot.direction.direction, (0, 0))
+
+
+program = CleanProgram
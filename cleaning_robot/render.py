@@ -0,0 +1,250 @@
+import os
+import struct
+import threading
+import zlib
+
+import numpy as np
+
+
+# Offline frame export
+class FrameExporter:
+    # writes frames of a room to disk straight from its class-id grid, without ipythonblocks or a display.
+    # a path with a format field in it (e.g. 'frames/{:05d}.png') gives a numbered png sequence, anything
+    # else is streamed as an animated gif. Each frame is written as soon as it arrives so memory stays
+    # bounded however long the run is. color is the same name -> rgb dict roomarea takes
+    def __init__(self, path, color, scale=10, frame_delay=0.1):
+        self.path = path
+        self.colors = color
+        self.scale = scale
+        self.frame_delay = frame_delay
+        self.sequence = '{' in path
+        self.frames = 0
+        self.file = None
+        self.palette = None
+        self.palette_size = 0
+        self.header_palette = None
+        folder = os.path.dirname(path)
+        if folder:
+            os.makedirs(folder, exist_ok=True)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def write(self, env):
+        grid = env.class_id_grid()
+        palette = self.get_palette(env)
+        # grid is indexed [x, y], images are stored row by row
+        ids = np.ascontiguousarray(grid.T)
+        if self.scale > 1:
+            ids = ids.repeat(self.scale, axis=0).repeat(self.scale, axis=1)
+        if self.sequence:
+            with open(self.path.format(self.frames), 'wb') as f:
+                f.write(png_bytes(palette[ids]))
+        else:
+            self.write_gif_frame(ids, palette)
+        self.frames += 1
+
+    def get_palette(self, env):
+        # class id -> rgb lookup table, so colouring a whole frame is a single indexing operation.
+        # rebuilt only when the room has handed out new class ids
+        if self.palette is None or len(env.class_names) != self.palette_size:
+            palette = np.empty((256, 3), dtype=np.uint8)
+            palette[:] = (200, 200, 200)
+            for class_id, name in env.class_names.items():
+                if name in self.colors:
+                    palette[class_id] = self.colors[name]
+            self.palette = palette
+            self.palette_size = len(env.class_names)
+        return self.palette
+
+    def write_gif_frame(self, ids, palette):
+        height, width = ids.shape
+        if self.file is None:
+            self.file = open(self.path, 'wb')
+            self.size = (width, height)
+            self.header_palette = palette.copy()
+            # header with a 256 colour global table, then the looping extension
+            self.file.write(b'GIF89a' + struct.pack('<HHBBB', width, height, 0xF7, 0, 0))
+            self.file.write(palette.tobytes())
+            self.file.write(b'\x21\xFF\x0BNETSCAPE2.0\x03\x01\x00\x00\x00')
+        if (width, height) != self.size:
+            raise ValueError("every gif frame has to be the same size, got {} after {}".format(
+                (width, height), self.size))
+        delay = int(round(self.frame_delay * 100))
+        self.file.write(b'\x21\xF9\x04\x00' + struct.pack('<H', delay) + b'\x00\x00')
+        if np.array_equal(palette, self.header_palette):
+            self.file.write(b'\x2C' + struct.pack('<HHHHB', 0, 0, width, height, 0))
+        else:
+            # a class turned up after the header was written, this frame carries its own colour table
+            self.file.write(b'\x2C' + struct.pack('<HHHHB', 0, 0, width, height, 0x87))
+            self.file.write(palette.tobytes())
+        data = lzw_encode(ids.tobytes())
+        self.file.write(b'\x08')
+        for start in range(0, len(data), 255):
+            block = data[start:start + 255]
+            self.file.write(bytes((len(block),)) + block)
+        self.file.write(b'\x00')
+
+    def close(self):
+        if self.file is not None:
+            self.file.write(b'\x3B')
+            self.file.close()
+            self.file = None
+
+
+def png_bytes(rgb):
+    # an rgb uint8 array of shape (height, width, 3) as a png file, using only zlib
+    height, width = rgb.shape[:2]
+    rows = np.zeros((height, width * 3 + 1), dtype=np.uint8)
+    rows[:, 1:] = rgb.reshape(height, width * 3)
+
+    def chunk(kind, data):
+        return struct.pack('>I', len(data)) + kind + data + struct.pack('>I', zlib.crc32(kind + data))
+
+    return (b'\x89PNG\r\n\x1a\n'
+            + chunk(b'IHDR', struct.pack('>IIBBBBB', width, height, 8, 2, 0, 0, 0))
+            + chunk(b'IDAT', zlib.compress(rows.tobytes(), 6))
+            + chunk(b'IEND', b''))
+
+
+def lzw_encode(pixels, min_code_size=8):
+    # gif flavoured lzw: variable width codes packed least significant bit first, up to 12 bits
+    clear = 1 << min_code_size
+    end = clear + 1
+    out = bytearray()
+    bits = 0
+    nbits = 0
+    size = min_code_size + 1
+    table = {}
+    next_code = end + 1
+
+    codes = [clear]
+    prefix = pixels[0]
+    for pixel in pixels[1:]:
+        key = (prefix << 8) | pixel
+        code = table.get(key)
+        if code is not None:
+            prefix = code
+            continue
+        codes.append(prefix)
+        if next_code < 4096:
+            table[key] = next_code
+            next_code += 1
+        else:
+            codes.append(clear)
+            table.clear()
+            next_code = end + 1
+        prefix = pixel
+    codes.append(prefix)
+    codes.append(end)
+
+    # the code width grows as the decoder's table does, and drops back after every clear code
+    next_code = end + 1
+    first = True
+    for code in codes:
+        bits |= code << nbits
+        nbits += size
+        while nbits >= 8:
+            out.append(bits & 0xFF)
+            bits >>= 8
+            nbits -= 8
+        if code == clear:
+            size = min_code_size + 1
+            next_code = end + 1
+            first = True
+        elif code != end:
+            if first:
+                first = False
+            else:
+                next_code += 1
+                if next_code == (1 << size) and size < 12:
+                    size += 1
+    if nbits:
+        out.append(bits & 0xFF)
+    return bytes(out)
+
+
+# Background rendering
+class ThreadedRenderer:
+    # draws frames on its own thread. The step loop publishes snapshots into a single pending slot and the
+    # thread draws whichever is newest, so a renderer that falls behind drops stale frames instead of
+    # holding up the simulation. render is any callable taking a Snapshot (a BlockGridView, an exporter's
+    # write, ...)
+    def __init__(self, render):
+        self.render = render
+        self.lock = threading.Lock()
+        self.ready = threading.Event()
+        self.pending = None
+        self.stopped = False
+        self.error = None
+        self.rendered = 0
+        self.dropped = 0
+        self.thread = threading.Thread(target=self.loop, daemon=True)
+        self.thread.start()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def publish(self, snapshot):
+        with self.lock:
+            if self.pending is not None:
+                self.dropped += 1
+            self.pending = snapshot
+        self.ready.set()
+
+    def loop(self):
+        while True:
+            self.ready.wait()
+            with self.lock:
+                snapshot, self.pending = self.pending, None
+                self.ready.clear()
+                stopped = self.stopped
+            if snapshot is not None and self.error is None:
+                try:
+                    self.render(snapshot)
+                    self.rendered += 1
+                except Exception as e:
+                    self.error = e
+            if stopped:
+                return
+
+    def close(self):
+        # draws the last published frame, then stops the thread
+        with self.lock:
+            self.stopped = True
+        self.ready.set()
+        self.thread.join()
+        if self.error is not None:
+            raise self.error
+
+
+class BlockGridView:
+    # draws snapshots into a notebook block grid, repainting only the cells that differ from the last frame
+    def __init__(self, color):
+        self.colors = color
+        self.grid = None
+        self.last = None
+
+    def __call__(self, snapshot):
+        from IPython.display import clear_output
+
+        ids = snapshot.class_id_grid()
+        if self.grid is None or self.last.shape != ids.shape:
+            from ipythonblocks import BlockGrid
+
+            self.grid = BlockGrid(ids.shape[0], ids.shape[1], fill=(200, 200, 200))
+            changed = np.argwhere(ids)
+        else:
+            changed = np.argwhere(ids != self.last)
+        for x, y in changed.tolist():
+            class_id = ids[x, y]
+            self.grid[y, x] = self.colors[snapshot.class_names[class_id]] if class_id else (200, 200, 200)
+        self.last = ids
+        clear_output(wait=True)
+        self.grid.show()
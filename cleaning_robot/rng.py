@@ -0,0 +1,40 @@
+# Random numbers for rooms and bots. Every room and every bot owns its own stream, and streams spawned
+# from one root seed never overlap, so runs are reproducible and independent even across worker processes.
+# Values come out of pre-drawn NumPy blocks so a bot picking a random move every step doesn't pay for a
+# generator call each time.
+import numpy as np
+
+
+def spawn_seeds(seed, count):
+    # count independent child seeds of seed (an int, None for fresh entropy, or a SeedSequence)
+    if not isinstance(seed, np.random.SeedSequence):
+        seed = np.random.SeedSequence(seed)
+    return seed.spawn(count)
+
+
+class RandomStream:
+    def __init__(self, seed=None, block=4096):
+        self.generator = np.random.default_rng(seed)
+        self.block = block
+        self.values = []
+        self.index = 0
+
+    def random(self):
+        # a float in [0, 1)
+        if self.index == len(self.values):
+            self.values = self.generator.random(self.block).tolist()
+            self.index = 0
+        value = self.values[self.index]
+        self.index += 1
+        return value
+
+    def below(self, n):
+        # an int in [0, n)
+        return int(self.random() * n)
+
+    def randint(self, a, b):
+        # an int in [a, b], both ends included like random.randint
+        return a + int(self.random() * (b - a + 1))
+
+    def choice(self, options):
+        return options[int(self.random() * len(options))]
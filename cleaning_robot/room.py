@@ -0,0 +1,225 @@
+import functools
+
+import numpy as np
+
+from .actions import ROUTINES, compile_routine, run_routine
+from .agents import Agent, Direction
+from .environment import Environment
+from .navigation import DistanceField
+from .percepts import Percept
+from .termination import CoverageReached
+from .things import Chair, Person, Trolley
+
+
+# set up specific room
+class roomarea(Environment):
+    def __init__(self, width, height, boundary=True, color={}, display=False, array_world=False, stop_when=(),
+                 seed=None, people_move=0.0, track_coverage=None):
+
+        super().__init__(width, height, boundary, color, display, array_world, stop_when, seed)
+        self.chairs = []
+        self.new_chair_index = 0
+        # bots that ran out of liquid and made it back to base
+        self.returned_empty = 0
+        # every cell a bot has had in its 3x3 view, self.covered counts them. Only kept when asked for or
+        # when a CoverageReached condition needs it, otherwise self.covered stays 0
+        if track_coverage is None:
+            track_coverage = any(isinstance(condition, CoverageReached) for condition in self.stop_when)
+        self.seen = np.zeros((width, height), dtype=bool) if track_coverage else None
+        # (x, y) -> the Percept a bot gets there facing each way (None until one has), dropped when a chair,
+        # trolley or person arrives at or leaves one of the 3x3 cells around it. Bots moving about don't
+        # change what's seen
+        self.percepts = {}
+        # (action, heading) -> what carries it out, see add_action
+        self.actions = {key: functools.partial(run_routine, routine=routine) for key, routine in ROUTINES.items()}
+        self.add_action('CleanChair', self.clean_chair)
+        self.add_action('CleanTrolley', self.clean_trolley)
+        # target -> DistanceField of moves there from every cell going round people, built the first time a
+        # bot heads for it (base is (0, 0))
+        self.fields = {}
+        # cells people have arrived at or left since, in order, and how far along it each field has caught up
+        self.people_moves = []
+        self.fields_seen = {}
+        # times a bot in refill mode has topped up at base
+        self.refills = 0
+        # how often a person without a scripted walk takes a step in a random direction, 0 keeps them still
+        self.people_move = people_move
+
+    def is_inbounds(self, location):
+
+        x, y = location
+        return not (x < self.x_start or x >= self.x_end or y < self.y_start or y >= self.y_end)
+
+    def get_world(self):
+        # built from the cell index so only occupied cells are looked at
+        result = [[[] for y in range(self.height)] for x in range(self.width)]
+        for key, things in self.cells.items():
+            if self.is_inbounds(key):
+                result[key[0]][key[1]] = list(things)
+        return result
+
+    def step(self):
+        # a bot at base in refill mode tops up while there's still something to clean, otherwise a bot at
+        # base that's used up its liquid (or in refill mode, has nothing left to do) is finished
+        for agent in self.agents:
+            if not agent.alive or agent.location[0] != 0 or agent.location[1] != 0:
+                continue
+            if agent.refill and self.left_to_clean():
+                if agent.cleaningliquid < agent.capacity:
+                    agent.refillLiquid()
+                    self.refills += 1
+            elif agent.cleaningliquid <= 0 or agent.refill:
+                agent.alive = False
+                if agent.cleaningliquid <= 0:
+                    self.returned_empty += 1
+                # the run is finished once every bot is done and back home
+                if self.alive_agents == 0:
+                    self.done = 0
+        super().step()
+
+    def exogenous_change(self):
+        # people walk about after the bots have moved, a step each at most: a person with a scripted walk
+        # steps towards the next cell of it, the rest step in a random direction people_move of the time.
+        # Nobody walks out of the room or onto a cell with anything in it, they wait instead
+        for cell in list(self.registries[Person].values()):
+            for person in list(cell):
+                x, y = person.location
+                if person.walk:
+                    # on to the cell after once they're on this one, without stopping there
+                    if (x, y) == person.walk[person.next]:
+                        person.next = (person.next + 1) % len(person.walk)
+                    tx, ty = person.walk[person.next]
+                    # across or up and down towards the next cell, the other way if the first is taken
+                    steps = []
+                    if tx != x:
+                        steps.append((x + (1 if tx > x else -1), y))
+                    if ty != y:
+                        steps.append((x, y + (1 if ty > y else -1)))
+                elif self.people_move and self.rng.random() < self.people_move:
+                    heading = self.rng.below(4)
+                    steps = [(x + Direction.DX[heading], y + Direction.DY[heading])]
+                else:
+                    continue
+                for target in steps:
+                    if self.is_inbounds(target) and not self.cells.get(target):
+                        self.move_thing(person, list(target))
+                        break
+
+    def left_to_clean(self):
+        return self.count_things(Chair) + self.count_things(Trolley)
+
+    def sense(self, location):
+        # marks the 3x3 block around a location as seen and counts how many cells that newly covered
+        x, y = location
+        block = self.seen[max(x - 1, 0):max(x + 2, 0), max(y - 1, 0):max(y + 2, 0)]
+        self.covered += block.size - np.count_nonzero(block)
+        block[:] = True
+
+    def percept(self, agent):
+        # the same record is handed out again for as long as nothing in view changes, so turning on the
+        # spot or walking back over a cell doesn't look at the neighbourhood again
+        if self.seen is not None:
+            self.sense(agent.location)
+        x, y = agent.location
+        records = self.percepts.get((x, y))
+        if records is None:
+            records = self.percepts[(x, y)] = [None, None, None, None]
+        heading = agent.direction.direction
+        if records[heading] is None:
+            records[heading] = Percept().fill(self, agent.location, agent.direction)
+        return records[heading]
+
+    def people_grid(self):
+        # True where someone is standing, read off the class-id grid. That only has the top thing in a cell,
+        # so anyone with a bot standing on them is added from the registry
+        grid = self.class_id_grid() == self.class_ids['Person']
+        for x, y in self.registries[Person]:
+            if self.is_inbounds((x, y)):
+                grid[x, y] = True
+        return grid
+
+    def field(self, target):
+        # people moving about only get noted down, a field catches up with them when it's next used
+        target = tuple(target)
+        moves = self.people_moves
+        if target not in self.fields:
+            self.fields[target] = DistanceField(self.width, self.height, self.people_grid(), target)
+        elif self.fields_seen[target] < len(moves):
+            people = self.registries[Person]
+            for cell in set(moves[self.fields_seen[target]:]):
+                self.fields[target].set_blocked(cell, cell in people)
+        self.fields_seen[target] = len(moves)
+        field = self.fields[target]
+        # a field that's fallen further behind than there are cells is cheaper to search again than to catch
+        # up, so it's forgotten, and what every field left has caught up with is dropped
+        if len(moves) > self.width * self.height:
+            for behind in [key for key, seen in self.fields_seen.items() if len(moves) - seen > self.width * self.height]:
+                del self.fields[behind]
+                del self.fields_seen[behind]
+            caught_up = min(self.fields_seen.values())
+            del moves[:caught_up]
+            for key in self.fields_seen:
+                self.fields_seen[key] -= caught_up
+        return field
+
+    def forget_field(self, target):
+        # a bot that's got where it was going drops the field that took it there, so the room only keeps
+        # fields someone is following (each one has to keep up with people walking about)
+        target = tuple(target)
+        if self.fields.pop(target, None) is not None:
+            del self.fields_seen[target]
+        if not self.fields:
+            self.people_moves.clear()
+
+    def way_to(self, agent, target):
+        # the next move on the shortest way to target, None once there or if people have it cut off
+        return self.field(target).step_from(agent.location, agent.direction.direction)
+
+    def way_home(self, agent):
+        return self.way_to(agent, (0, 0))
+
+    def cell_changed(self, key, thing):
+        if isinstance(thing, Agent):
+            return
+        if isinstance(thing, Person) and self.fields and self.is_inbounds(key):
+            self.people_moves.append(key)
+        if not self.percepts:
+            return
+        x, y = key
+        for dx in (-1, 0, 1):
+            for dy in (-1, 0, 1):
+                self.percepts.pop((x + dx, y + dy), None)
+
+    # At first I tried to mak it clean in different directions in the program but realised the bot may not be looking in the
+    # same direction when it sees items and program doesn't implement agents direction
+    def execute_action(self, agent, action):
+        # changes the state of the environment based on what the agent does, one lookup on the action and
+        # the way the bot is facing. Actions the room doesn't know do nothing
+        handler = self.actions.get((action, agent.direction.direction))
+        if handler is not None:
+            handler(agent)
+
+    def add_action(self, name, action):
+        # action is either a function taking the bot, or a macro: four strings of F, L and R moves, one for
+        # each heading the bot might start from (up, right, down, left)
+        if callable(action):
+            for heading in Direction.CODES.values():
+                self.actions[(name, heading)] = action
+        else:
+            for heading, moves in enumerate(action):
+                self.actions[(name, heading)] = functools.partial(run_routine, routine=compile_routine(moves))
+
+    # these next two actions check if the action is to clean
+    # once the bot is out of liquid the program only takes it home (see way_home), so a check for liquid isn't needed
+    def clean_chair(self, agent):
+        self.clean(agent, Chair, agent.CleanChair)
+
+    def clean_trolley(self, agent):
+        self.clean(agent, Trolley, agent.CleanTrolley)
+
+    def clean(self, agent, tclass, check):
+        items = self.list_things_at(agent.location, tclass=tclass)
+        if len(items) != 0 and check(items[0]):
+            agent.useLiquid()
+            self.delete_thing(items[0])
+            self.cleaned += 1
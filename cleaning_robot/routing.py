@@ -0,0 +1,204 @@
+# Planning trips out from base when the bot can't carry enough liquid to clean everything in one go.
+# Every chair and trolley takes one unit of liquid, each trip starts and ends at base (where the bot
+# refills), and the trips are put together with the Clarke-Wright savings heuristic: start with a trip per
+# stop, then keep joining the two trips whose join saves the most walking while they still fit in the tank.
+import numpy as np
+
+
+def manhattan(a, b):
+    return abs(a[0] - b[0]) + abs(a[1] - b[1])
+
+
+def plan_trips(stops, capacity, distance=manhattan, depot=(0, 0)):
+    # stops is where the things to clean are, capacity how many the bot can clean per trip and distance(a, b)
+    # the moves between two cells. Returns a list of trips, each the stops to visit in order
+    if capacity < 1:
+        raise ValueError("a trip has to be able to clean at least one thing, got capacity={}".format(capacity))
+    stops = [tuple(stop) for stop in stops]
+    depot = tuple(depot)
+    routes = {i: [i] for i in range(len(stops))}
+    route_of = list(range(len(stops)))
+    to_depot = [distance(depot, stop) for stop in stops]
+    # what joining i and j in one trip saves over going out to each from base separately, best first
+    savings = sorted(((to_depot[i] + to_depot[j] - distance(stops[i], stops[j]), i, j)
+                      for i in range(len(stops)) for j in range(i + 1, len(stops))),
+                     key=lambda saving: (-saving[0], saving[1], saving[2]))
+    for saving, i, j in savings:
+        first, second = route_of[i], route_of[j]
+        if first == second:
+            continue
+        a, b = routes[first], routes[second]
+        if len(a) + len(b) > capacity:
+            continue
+        # trips can only be joined end to end, so i and j both have to be at an end of theirs
+        if a[-1] == i and b[0] == j:
+            joined = a + b
+        elif a[0] == i and b[-1] == j:
+            joined = b + a
+        elif a[-1] == i and b[-1] == j:
+            joined = a + b[::-1]
+        elif a[0] == i and b[0] == j:
+            joined = a[::-1] + b
+        else:
+            continue
+        routes[first] = joined
+        del routes[second]
+        for stop in b:
+            route_of[stop] = first
+    return [[stops[stop] for stop in route] for route in routes.values()]
+
+
+def trips_length(trips, distance=manhattan, depot=(0, 0)):
+    # the moves it takes to do every trip, out from base and back
+    total = 0
+    for trip in trips:
+        here = tuple(depot)
+        for stop in trip:
+            total += distance(here, stop)
+            here = stop
+        total += distance(here, depot)
+    return total
+
+
+# Tours for a bot that knows where everything is. A tour starts and ends at base and visits every stop:
+# built nearest first, then shortened with 2-opt (reversing a stretch of the tour) and Or-opt (moving a run
+# of up to three stops elsewhere). Both only try joining a stop to its few nearest stops, which keeps them
+# fast with thousands of stops. Distances are Manhattan, the moves a bot takes with nothing in its way.
+
+def nearest_stops(xs, ys, count, chunk=512):
+    # for every point, the indices of the count nearest other points
+    count = min(count, len(xs) - 1)
+    nearest = np.empty((len(xs), count), dtype=np.int64)
+    for start in range(0, len(xs), chunk):
+        rows = slice(start, start + chunk)
+        distances = np.abs(xs[rows, None] - xs[None, :]) + np.abs(ys[rows, None] - ys[None, :])
+        distances[np.arange(len(distances)), np.arange(start, start + len(distances))] = np.iinfo(np.int64).max
+        closest = np.argpartition(distances, count - 1, axis=1)[:, :count]
+        order = np.argsort(np.take_along_axis(distances, closest, axis=1), axis=1)
+        nearest[rows] = np.take_along_axis(closest, order, axis=1)
+    return nearest.tolist()
+
+
+def nearest_first(xs, ys, budget):
+    # the tour as point indices from base (point 0), always on to the nearest point not visited yet,
+    # stopping after budget points
+    unvisited = np.ones(len(xs), dtype=bool)
+    unvisited[0] = False
+    tour = [0]
+    here = 0
+    for step in range(budget):
+        distances = np.abs(xs - xs[here]) + np.abs(ys - ys[here])
+        distances[~unvisited] = np.iinfo(np.int64).max
+        here = int(distances.argmin())
+        unvisited[here] = False
+        tour.append(here)
+    return tour
+
+
+def improve_tour(tour, xs, ys, neighbours=8):
+    # 2-opt and Or-opt moves over each point's nearest neighbours until none of them shortens the tour.
+    # tour[0] is base and stays put, the tour closes back to it
+    xs = xs.tolist()
+    ys = ys.tolist()
+    size = len(tour)
+    if size < 4:
+        return tour
+
+    def distance(a, b):
+        return abs(xs[a] - xs[b]) + abs(ys[a] - ys[b])
+
+    candidates = nearest_stops(np.array([xs[point] for point in tour]), np.array([ys[point] for point in tour]),
+                               neighbours)
+    # work in positions of the tour given (0 .. size - 1) and map back at the end
+    points = tour
+    tour = list(range(size))
+    position = list(range(size))
+    xs = [xs[point] for point in points]
+    ys = [ys[point] for point in points]
+    improved = True
+    while improved:
+        improved = False
+        for a in range(size):
+            for b in candidates[a]:
+                # 2-opt: edges (a, after a) and (b, after b) become (a, b) and (after a, after b)
+                i, j = position[a], position[b]
+                if i > j:
+                    i, j = j, i
+                first, second = tour[i], tour[j]
+                after_first, after_second = tour[i + 1], tour[(j + 1) % size]
+                if after_first == second:
+                    continue
+                gain = (distance(first, after_first) + distance(second, after_second)
+                        - distance(first, second) - distance(after_first, after_second))
+                if gain > 0:
+                    tour[i + 1:j + 1] = tour[i + 1:j + 1][::-1]
+                    for k in range(i + 1, j + 1):
+                        position[tour[k]] = k
+                    improved = True
+        for length in (1, 2, 3):
+            for start in range(1, size - length + 1):
+                # Or-opt: take the run tour[start:start + length] out and put it back between c and the stop
+                # after c, either way round, for c near either end of the run
+                run = tour[start:start + length]
+                before, after = tour[start - 1], tour[(start + length) % size]
+                removed = distance(before, run[0]) + distance(run[-1], after) - distance(before, after)
+                best = None
+                for c in candidates[run[0]] + candidates[run[-1]]:
+                    k = position[c]
+                    if start - 1 <= k < start + length:
+                        continue
+                    next_c = tour[(k + 1) % size]
+                    for forward in (True, False):
+                        head, tail = (run[0], run[-1]) if forward else (run[-1], run[0])
+                        added = distance(c, head) + distance(tail, next_c) - distance(c, next_c)
+                        if removed - added > 0 and (best is None or removed - added > best[0]):
+                            best = (removed - added, c, forward)
+                if best is not None:
+                    gain, c, forward = best
+                    del tour[start:start + length]
+                    k = tour.index(c)
+                    tour[k + 1:k + 1] = run if forward else run[::-1]
+                    for k in range(size):
+                        position[tour[k]] = k
+                    improved = True
+    return [points[point] for point in tour]
+
+
+def plan_tour(stops, depot=(0, 0), budget=None, neighbours=8):
+    # the stops in the order to visit them on a short tour out from depot and back. With a budget (the
+    # bot's liquid) smaller than the number of stops only that many are visited, the nearest first
+    stops = [tuple(stop) for stop in stops]
+    budget = len(stops) if budget is None else min(budget, len(stops))
+    xs = np.array([depot[0]] + [x for x, y in stops], dtype=np.int64)
+    ys = np.array([depot[1]] + [y for x, y in stops], dtype=np.int64)
+    tour = improve_tour(nearest_first(xs, ys, budget), xs, ys, neighbours)
+    return [stops[point - 1] for point in tour[1:]]
+
+
+def split_tour(tour, capacity, distance=manhattan, depot=(0, 0)):
+    # cuts a tour into trips of at most capacity stops, back to depot between them, at the places that
+    # make the trips shortest overall (dynamic programming over where each trip ends, O(stops * capacity))
+    if capacity < 1:
+        raise ValueError("a trip has to be able to clean at least one thing, got capacity={}".format(capacity))
+    depot = tuple(depot)
+    tour = [tuple(stop) for stop in tour]
+    # along[i] is the distance walked from tour[0] to tour[i] going through the tour
+    along = [0]
+    for a, b in zip(tour, tour[1:]):
+        along.append(along[-1] + distance(a, b))
+    best = [0] + [None] * len(tour)
+    cut = [0] * (len(tour) + 1)
+    for end in range(1, len(tour) + 1):
+        for start in range(max(0, end - capacity), end):
+            # a trip visiting tour[start:end]
+            cost = (best[start] + distance(depot, tour[start]) + along[end - 1] - along[start]
+                    + distance(tour[end - 1], depot))
+            if best[end] is None or cost < best[end]:
+                best[end] = cost
+                cut[end] = start
+    trips = []
+    end = len(tour)
+    while end:
+        trips.append(tour[cut[end]:end])
+        end = cut[end]
+    return trips[::-1]
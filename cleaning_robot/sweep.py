@@ -0,0 +1,59 @@
+# The sweep the optimal bot follows. The bot sees the 3x3 block around itself, so walking along every third
+# column (1, 4, 7, ...) sees every cell in the room, with the last column moved in to the second last one
+# (it sees the last column from there and is a move nearer) (the plan worked out in the notes at the end of
+# AI Class Robot.py). Columns are walked down and up in turn between the second row and the second last,
+# which see the first and last rows. A room taller than it is wide is swept along its rows the same way
+# instead, whichever of the two walks is shorter from base.
+from .agents import Direction
+from .navigation import steer
+from .routing import manhattan
+
+
+def sweep_columns(width):
+    # the x of every column the bot walks, ceil(width / 3) of them
+    count = -(-width // 3)
+    return [1 + 3 * i for i in range(count - 1)] + [max(width - 2, 0)]
+
+
+def sweep_rows(height):
+    # the first and last rows a column is walked between
+    top = min(1, height - 1)
+    return top, max(height - 2, top)
+
+
+def plan_lines(width, height):
+    # the ends of the columns in the order they're visited, top and bottom of each
+    top, bottom = sweep_rows(height)
+    waypoints = []
+    for i, x in enumerate(sweep_columns(width)):
+        ends = ((x, top), (x, bottom)) if i % 2 == 0 else ((x, bottom), (x, top))
+        waypoints.extend(ends)
+    return waypoints
+
+
+def sweep_length(waypoints, start=(0, 0)):
+    # the moves it takes to walk the sweep from start
+    return sum(manhattan(a, b) for a, b in zip([start] + waypoints, waypoints))
+
+
+def plan_sweep(width, height):
+    # the corners of the sweep in the order they're visited, O(width + height) of them for any room:
+    # down and up columns, or along rows when that's the shorter walk
+    columns = plan_lines(width, height)
+    rows = [(x, y) for y, x in plan_lines(height, width)]
+    return rows if sweep_length(rows) < sweep_length(columns) else columns
+
+
+def step_towards(location, heading, target):
+    # the action that takes a bot at location facing heading (a Direction code) a step nearer target,
+    # as the crow flies. None once it's there
+    x, y = location
+    tx, ty = target
+    wanted = []
+    if tx != x:
+        wanted.append(Direction.R if tx > x else Direction.L)
+    if ty != y:
+        wanted.append(Direction.D if ty > y else Direction.U)
+    if not wanted:
+        return None
+    return steer(heading, wanted)
@@ -0,0 +1,43 @@
+# Conditions that end a run, passed to an environment as stop_when=[...]. Each one is checked after every
+# step and only reads counters the environment keeps up to date as things happen, so checking them costs
+# the same however big the room is. The name of the one that fired ends up as the run's reason.
+from .things import Chair, Trolley
+
+
+class AllCleaned:
+    # every chair and trolley in the room has been cleaned
+    name = 'all cleaned'
+
+    def __call__(self, env):
+        return env.count_things(Chair) + env.count_things(Trolley) == 0
+
+
+class LiquidExhausted:
+    # every bot has used up its cleaning liquid and made it back to base
+    name = 'liquid exhausted'
+
+    def __call__(self, env):
+        return env.returned_empty >= len(env.agents)
+
+
+class StepBudget:
+    # the room has been stepped a given number of times
+    name = 'step budget'
+
+    def __init__(self, steps):
+        self.steps = steps
+
+    def __call__(self, env):
+        return env.steps >= self.steps
+
+
+class CoverageReached:
+    # the bots have seen at least this fraction of the room's cells. A room only counts what's been seen
+    # when it's given one of these to begin with (or track_coverage=True)
+    name = 'coverage reached'
+
+    def __init__(self, fraction=1.0):
+        self.fraction = fraction
+
+    def __call__(self, env):
+        return env.covered >= self.fraction * env.width * env.height
@@ -0,0 +1,33 @@
+#Making Thing objects
+class Thing:
+
+    def __repr__(self):
+        return '<{}>'.format(getattr(self, '__name__', self.__class__.__name__))
+
+    def is_alive(self):
+        return hasattr(self, 'alive') and self.alive
+
+    def display(self, canvas, x, y, width, height):
+        pass
+
+class Chair(Thing):
+    pass
+
+class Trolley(Thing):
+    pass
+
+class Person(Thing):
+    # people walk about the room (see roomarea.exogenous_change). walk, when given, is a list of cells the
+    # person goes round in a loop, walking a step at a time from each to the next, otherwise they wander
+    # at random
+    def __init__(self, walk=None):
+        self.walk = [tuple(cell) for cell in walk] if walk else None
+        self.next = 0
+
+class Bump(Thing):
+    pass
+
+
+# class ids used by the array-backed world, 0 is an empty cell. Other classes get the next free id
+# the first time they're added to a room
+CLASS_IDS = {'CleanBot': 1, 'Chair': 2, 'Trolley': 3, 'Person': 4}
@@ -0,0 +1,34 @@
+# Bots (and the shared Direction headings they hold) have to survive copying and pickling, e.g. to be
+# handed to another process
+import copy
+import pickle
+
+from cleaning_robot import Direction, make_room
+
+
+def test_direction_copies_are_the_shared_heading():
+    down = Direction('down')
+    assert copy.copy(down) is down
+    assert copy.deepcopy(down) is down
+    assert pickle.loads(pickle.dumps(down)) is down
+
+
+def test_bot_round_trips():
+    room, bot = make_room(8, 4, 2, seed=1)
+    for step in range(10):
+        room.step()
+    for clone in (pickle.loads(pickle.dumps(bot)), copy.deepcopy(bot)):
+        assert clone.direction is bot.direction
+        assert list(clone.location) == list(bot.location)
+        assert clone.cleaningliquid == bot.cleaningliquid
+        assert list(clone.path) == list(bot.path)
+
+
+def test_copied_room_runs_the_same():
+    room, bot = make_room(8, 4, 2, seed=1)
+    for step in range(10):
+        room.step()
+    clone = pickle.loads(pickle.dumps(room))
+    assert copy.deepcopy(room).steps == room.steps
+    first = room.run(500, headless=True)
+    assert clone.run(500, headless=True) == first
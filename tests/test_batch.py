@@ -0,0 +1,34 @@
+# BatchRooms has to step a room the way roomarea does: the actions CleanProgram picks in a roomarea are
+# replayed in a batch of that one room and the bot has to end up in the same place after every step
+import numpy as np
+
+from cleaning_robot import BatchProgram, BatchRooms, make_room
+from cleaning_robot.batch import ACTION_CODES
+
+
+def test_replayed_actions_match_roomarea():
+    compared = 0
+    for seed in range(40):
+        room, bot = make_room(4 + seed % 12, 3, 1, optimal=seed % 2 == 0, seed=seed)
+        batch = BatchRooms.from_rooms([room])
+        for step in range(300):
+            if room.is_done() or (bot.cleaningliquid <= 0 and list(bot.location) == [0, 0]):
+                break
+            action = bot.program(room.percept(bot))
+            room.execute_action(bot, action)
+            # a bot in a batch can't leave its room, CleanBot can
+            if not room.is_inbounds(bot.location):
+                break
+            batch.step(np.array([ACTION_CODES[action]]))
+            assert tuple(batch.positions[0]) == tuple(bot.location)
+            assert batch.headings[0] == bot.direction.direction
+            assert batch.liquid[0] == bot.cleaningliquid
+            compared += 1
+    assert compared > 1000
+
+
+def test_batch_program_finishes_rooms():
+    batch = BatchRooms.random(200, 8, 8, 3, 1, 2, rng=1)
+    batch.run(BatchProgram(len(batch), rng=2), 2000)
+    assert batch.done.all()
+    assert (batch.cleaned == 5).all()
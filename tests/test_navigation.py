@@ -0,0 +1,95 @@
+# DistanceField patched as cells are blocked and freed, checked against a field searched from scratch
+import random
+
+import numpy as np
+
+from cleaning_robot import Person, TripProgram, make_room
+from cleaning_robot.navigation import UNREACHABLE, DistanceField
+
+
+def fresh_distances(width, height, blocked, target):
+    # a plain breadth first search over (x, y) cells, nothing shared with DistanceField
+    distances = {target: 0}
+    queue = [target]
+    for x, y in queue:
+        for nx, ny in ((x, y - 1), (x + 1, y), (x, y + 1), (x - 1, y)):
+            if 0 <= nx < width and 0 <= ny < height and (nx, ny) not in blocked and (nx, ny) not in distances:
+                distances[(nx, ny)] = distances[(x, y)] + 1
+                queue.append((nx, ny))
+    return distances
+
+
+def test_search_matches_breadth_first_search():
+    rng = random.Random(1)
+    for trial in range(100):
+        width, height = rng.randint(1, 15), rng.randint(1, 15)
+        target = (rng.randrange(width), rng.randrange(height))
+        blocked = {(rng.randrange(width), rng.randrange(height)) for i in range(width * height // 3)} - {target}
+        field = DistanceField(width, height, blocked, target)
+        expected = fresh_distances(width, height, blocked, target)
+        for x in range(width):
+            for y in range(height):
+                assert field.distance((x, y)) == expected.get((x, y), UNREACHABLE)
+
+
+def test_grid_and_cells_give_the_same_field():
+    blocked = np.zeros((7, 5), dtype=bool)
+    blocked[2, :4] = True
+    cells = [(2, y) for y in range(4)]
+    assert (DistanceField(7, 5, blocked, (6, 0)).distances == DistanceField(7, 5, cells, (6, 0)).distances).all()
+
+
+def test_patched_field_matches_fresh_search():
+    # people stepping on and off cells between reads. step_from only patches in what could change the cells
+    # round the bot, so it has to pick the same step as a fresh field and have every distance up to the
+    # bot's best neighbour right; distance() patches in everything
+    rng = random.Random(2)
+    for trial in range(200):
+        width, height = rng.randint(1, 12), rng.randint(1, 12)
+        target = (rng.randrange(width), rng.randrange(height))
+        blocked = {(rng.randrange(width), rng.randrange(height)) for i in range(width * height // 4)} - {target}
+        field = DistanceField(width, height, blocked, target)
+        for move in range(30):
+            for change in range(rng.randint(1, 6)):
+                cell = (rng.randrange(width), rng.randrange(height))
+                now = rng.random() < 0.5
+                field.set_blocked(cell, now)
+                if cell != target:
+                    (blocked.add if now else blocked.discard)(cell)
+            fresh = DistanceField(width, height, blocked, target)
+            location = (rng.randrange(width), rng.randrange(height))
+            heading = rng.randrange(4)
+            assert field.step_from(location, heading) == fresh.step_from(location, heading)
+
+            x, y = location
+            best = min(fresh.distance(cell) for cell in ((x, y - 1), (x + 1, y), (x, y + 1), (x - 1, y)))
+            near = (field.distances <= best) | (fresh.distances <= best)
+            assert (field.distances[near] == fresh.distances[near]).all()
+            if move % 5 == 4:
+                field.distance(location)
+                assert (field.distances == fresh.distances).all()
+                assert not field.pending
+
+
+def test_room_fields_keep_up_with_people_walking():
+    checked = 0
+    for seed in range(15):
+        room, bot = make_room(6 + seed % 8, 4, 2, seed=seed, people_move=0.5, capacity=2, program=TripProgram)
+        for extra in range(6):
+            location = [int(room.rng.below(room.width)), int(room.rng.below(room.height))]
+            if location != [0, 0] and not room.list_things_at(location):
+                room.add_thing(Person(), location)
+        room.add_thing(Person(walk=[(1, 2), (2, 2), (3, 2), (2, 2)]), [room.width - 1, room.height - 1])
+        for step in range(300):
+            if room.is_done():
+                break
+            room.step()
+            for target in list(room.fields):
+                field = room.field(target)
+                field.distance((0, 0))
+                fresh = fresh_distances(room.width, room.height, set(room.registries[Person]) - {target}, target)
+                for x in range(room.width):
+                    for y in range(room.height):
+                        assert field.distance((x, y)) == fresh.get((x, y), UNREACHABLE)
+                checked += 1
+    assert checked
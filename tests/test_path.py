@@ -0,0 +1,82 @@
+# Path against a plain list of the points, for every limit x rle combination
+import random
+
+import pytest
+
+from cleaning_robot import Path
+
+
+def walk(rng, steps):
+    # mostly straight runs with turns and the odd stop or jump, like a bot's trail
+    x, y, dx, dy = 0, 0, 1, 0
+    points = [(x, y)]
+    for step in range(steps):
+        roll = rng.random()
+        if roll < 0.2:
+            dx, dy = rng.choice(((0, 1), (1, 0), (0, -1), (-1, 0)))
+        elif roll < 0.25:
+            dx, dy = 0, 0
+        elif roll < 0.27:
+            x, y = rng.randrange(-5, 5), rng.randrange(-5, 5)
+        x, y = x + dx, y + dy
+        points.append((x, y))
+    return points
+
+
+def runs_of(points):
+    # the runs an rle path splits points into: a run's second point sets its step, then only points carrying
+    # on in the same line join it
+    runs = []
+    for x, y in points:
+        if runs:
+            run = runs[-1]
+            x0, y0 = run[0]
+            if len(run) == 1:
+                run.append((x, y))
+                continue
+            dx, dy = run[1][0] - x0, run[1][1] - y0
+            if (x, y) == (x0 + len(run) * dx, y0 + len(run) * dy):
+                run.append((x, y))
+                continue
+        runs.append([(x, y)])
+    return runs
+
+
+def held(points, limit, rle):
+    # the points a path with this limit still holds after all of points went in
+    if not rle:
+        return points if limit is None else points[-limit:]
+    runs = runs_of(points)
+    if limit is not None:
+        runs = runs[-limit:]
+    return [point for run in runs for point in run]
+
+
+@pytest.mark.parametrize('rle', [False, True])
+@pytest.mark.parametrize('limit', [None, 1, 3, 50])
+def test_path_matches_a_list(limit, rle):
+    rng = random.Random(limit or 0)
+    points = walk(rng, 400)
+    path = Path(limit, rle)
+    for count, point in enumerate(points, 1):
+        path.append(point)
+        expected = held(points[:count], limit, rle)
+        assert len(path) == len(expected)
+        assert path.total == count
+        assert path.dropped == count - len(expected)
+        assert path[-1] == expected[-1]
+        assert path[0] == expected[0]
+        if count % 37 == 0:
+            assert [tuple(point) for point in path.to_array().tolist()] == expected
+            assert list(path) == expected
+            for index in range(-len(expected), len(expected)):
+                assert path[index] == expected[index]
+    with pytest.raises(IndexError):
+        path[len(path)]
+    with pytest.raises(IndexError):
+        path[-len(path) - 1]
+
+
+def test_limit_has_to_hold_something():
+    with pytest.raises(ValueError):
+        Path(limit=0)
@@ -0,0 +1,17 @@
+# Programs driving a bot round a room
+from cleaning_robot import TripProgram, make_room
+
+
+def test_trips_only_keep_the_fields_being_followed():
+    # base's field and the one to the stop the bot is heading for, however many stops there are
+    for seed in range(5):
+        room, bot = make_room(20, 15, 6, seed=seed, capacity=3, program=TripProgram, people_move=0.5)
+        most = 0
+        for step in range(3000):
+            if room.is_done():
+                break
+            room.step()
+            most = max(most, len(room.fields))
+        assert room.left_to_clean() == 0
+        assert most <= 2
+        assert list(room.fields) == [(0, 0)]
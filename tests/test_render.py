@@ -0,0 +1,112 @@
+# Frames written by FrameExporter read back with a gif decoder written from the format, nothing shared with
+# the encoder in render.py
+import random
+import struct
+
+import numpy as np
+
+from cleaning_robot import COLORS, FrameExporter, make_room
+from cleaning_robot.render import lzw_encode
+
+
+def lzw_decode(data, min_code_size=8):
+    clear = 1 << min_code_size
+    end = clear + 1
+    out = bytearray()
+    position = 0
+    size = min_code_size + 1
+    table = []
+    previous = None
+    while True:
+        code = 0
+        for bit in range(size):
+            code |= ((data[(position + bit) >> 3] >> ((position + bit) & 7)) & 1) << bit
+        position += size
+        if code == clear:
+            table = [bytes((i,)) for i in range(clear)] + [b'', b'']
+            size = min_code_size + 1
+            previous = None
+            continue
+        if code == end:
+            return bytes(out)
+        if previous is None:
+            entry = table[code]
+        else:
+            entry = table[code] if code < len(table) else table[previous] + table[previous][:1]
+            if len(table) < 4096:
+                table.append(table[previous] + entry[:1])
+        out += entry
+        previous = code
+        if len(table) == 1 << size and size < 12:
+            size += 1
+
+
+def read_gif(path):
+    # the (height, width) palette indices of every frame and the colour table it's drawn with
+    with open(path, 'rb') as f:
+        data = f.read()
+    assert data[:6] == b'GIF89a'
+    width, height, flags = struct.unpack('<HHB', data[6:11])
+    position = 13
+    palette = None
+    if flags & 0x80:
+        colours = 3 << ((flags & 7) + 1)
+        palette = np.frombuffer(data[position:position + colours], dtype=np.uint8).reshape(-1, 3)
+        position += colours
+    frames = []
+    while data[position] != 0x3B:
+        kind = data[position]
+        if kind == 0x21:
+            # an extension: its label, then sub-blocks up to an empty one
+            position += 2
+            while data[position]:
+                position += data[position] + 1
+            position += 1
+            continue
+        assert kind == 0x2C
+        frame_width, frame_height, flags = struct.unpack('<4xHHB', data[position + 1:position + 10])
+        position += 10
+        frame_palette = palette
+        if flags & 0x80:
+            colours = 3 << ((flags & 7) + 1)
+            frame_palette = np.frombuffer(data[position:position + colours], dtype=np.uint8).reshape(-1, 3)
+            position += colours
+        min_code_size = data[position]
+        position += 1
+        stream = bytearray()
+        while data[position]:
+            stream += data[position + 1:position + 1 + data[position]]
+            position += data[position] + 1
+        position += 1
+        pixels = np.frombuffer(lzw_decode(bytes(stream), min_code_size), dtype=np.uint8)
+        frames.append((pixels.reshape(frame_height, frame_width), frame_palette))
+    assert (width, height) == frames[0][0].shape[::-1]
+    return frames
+
+
+def test_lzw_round_trip():
+    rng = random.Random(3)
+    for length, colours in ((1, 1), (2, 2), (100, 3), (5000, 5), (20000, 256)):
+        pixels = bytes(rng.randrange(colours) for i in range(length))
+        assert lzw_decode(lzw_encode(pixels)) == pixels
+    # long runs fill the table quickly and send clear codes
+    pixels = bytes(i // 7 % 256 for i in range(200000))
+    assert lzw_decode(lzw_encode(pixels)) == pixels
+
+
+def test_gif_frames_read_back(tmp_path):
+    room, bot = make_room(9, 5, 2, seed=4)
+    path = str(tmp_path / 'run.gif')
+    grids = []
+    with FrameExporter(path, COLORS, scale=3) as exporter:
+        for step in range(12):
+            exporter.write(room)
+            grids.append(room.class_id_grid().copy())
+            room.step()
+    frames = read_gif(path)
+    assert len(frames) == len(grids)
+    for (pixels, palette), grid in zip(frames, grids):
+        assert (pixels == grid.T.repeat(3, axis=0).repeat(3, axis=1)).all()
+        for name, class_id in room.class_ids.items():
+            if name in COLORS:
+                assert tuple(palette[class_id]) == COLORS[name]
@@ -0,0 +1,50 @@
+# People walking about a roomarea
+from cleaning_robot import Chair, Person, roomarea
+
+
+def walk(room, person, steps):
+    trail = []
+    for step in range(steps):
+        room.exogenous_change()
+        trail.append(tuple(person.location))
+    return trail
+
+
+def test_scripted_walk_goes_a_step_at_a_time():
+    room = roomarea(10, 10)
+    person = Person(walk=[(1, 2), (2, 2), (3, 2)])
+    room.add_thing(person, [9, 9])
+    trail = walk(room, person, 40)
+    for before, after in zip([(9, 9)] + trail, trail):
+        assert abs(before[0] - after[0]) + abs(before[1] - after[1]) == 1
+    # 15 steps to the first cell of the walk, then round it without stopping at any of them
+    assert trail[14] == (1, 2)
+    assert trail[15:21] == [(2, 2), (3, 2), (2, 2), (1, 2), (2, 2), (3, 2)]
+
+
+def test_walkers_go_round_things_or_wait():
+    room = roomarea(5, 5)
+    room.add_thing(Chair(), [2, 0])
+    person = Person(walk=[(4, 1), (0, 0)])
+    room.add_thing(person, [0, 0])
+    trail = walk(room, person, 12)
+    assert (2, 0) not in trail
+    assert (4, 1) in trail
+    # boxed in, they stay put
+    room = roomarea(3, 1)
+    room.add_thing(Chair(), [1, 0])
+    person = Person(walk=[(2, 0)])
+    room.add_thing(person, [0, 0])
+    assert walk(room, person, 3) == [(0, 0)] * 3
+
+
+def test_people_stay_still_by_default():
+    room = roomarea(6, 6, seed=1)
+    person = Person()
+    room.add_thing(person, [3, 3])
+    assert walk(room, person, 20) == [(3, 3)] * 20
+    room = roomarea(6, 6, seed=1, people_move=1.0)
+    person = Person()
+    room.add_thing(person, [3, 3])
+    trail = walk(room, person, 20)
+    assert len(set(trail)) > 1
@@ -0,0 +1,69 @@
+# Tours and trips planned in routing.py, small ones checked against every possible order
+import itertools
+import random
+
+from cleaning_robot.routing import manhattan, plan_tour, plan_trips, split_tour, trips_length
+
+
+def random_stops(rng, count, side=10):
+    return rng.sample([(x, y) for x in range(side) for y in range(side) if (x, y) != (0, 0)], count)
+
+
+def test_tour_visits_every_stop_once():
+    rng = random.Random(1)
+    for count in (0, 1, 2, 5, 50, 400):
+        stops = random_stops(rng, count, side=40)
+        assert sorted(plan_tour(stops)) == sorted(stops)
+
+
+def test_tour_with_a_budget_visits_that_many():
+    rng = random.Random(2)
+    stops = random_stops(rng, 60, side=30)
+    tour = plan_tour(stops, budget=10)
+    assert len(tour) == 10 and len(set(tour)) == 10 and set(tour) <= set(stops)
+
+
+def test_small_tours_near_the_best_order():
+    # 2-opt and Or-opt aren't exact, but on a handful of stops they should rarely be beaten
+    rng = random.Random(5)
+    excess = 0
+    for trial in range(150):
+        stops = random_stops(rng, rng.randint(1, 7))
+        length = trips_length([plan_tour(stops)])
+        best = min(trips_length([list(order)]) for order in itertools.permutations(stops))
+        assert length <= best * 1.1
+        excess += length - best
+    assert excess <= 10
+
+
+def test_split_tour_cuts_in_the_best_places():
+    rng = random.Random(6)
+    for trial in range(100):
+        tour = random_stops(rng, rng.randint(1, 8))
+        capacity = rng.randint(1, 4)
+        trips = split_tour(tour, capacity)
+        assert [stop for trip in trips for stop in trip] == tour
+        assert max(len(trip) for trip in trips) <= capacity
+        # every way of cutting the tour into trips that fit, the shortest of them
+        best = None
+        for cuts in itertools.product((False, True), repeat=len(tour) - 1):
+            pieces, start = [], 0
+            for i, cut in enumerate(cuts, 1):
+                if cut:
+                    pieces.append(tour[start:i])
+                    start = i
+            pieces.append(tour[start:])
+            if max(len(piece) for piece in pieces) <= capacity:
+                length = trips_length(pieces)
+                best = length if best is None else min(best, length)
+        assert trips_length(trips) == best
+
+
+def test_trips_fit_the_tank():
+    rng = random.Random(7)
+    stops = random_stops(rng, 40, side=20)
+    trips = plan_trips(stops, 6)
+    assert sorted(stop for trip in trips for stop in trip) == sorted(stops)
+    assert max(len(trip) for trip in trips) <= 6
+    # never worse than going out to every stop on its own
+    assert trips_length(trips) <= sum(2 * manhattan((0, 0), stop) for stop in stops)
@@ -0,0 +1,45 @@
+# The optimal bot's sweep has to see every cell of the room, whatever its size
+import pytest
+
+from cleaning_robot.agents import Direction
+from cleaning_robot.sweep import plan_lines, plan_sweep, step_towards, sweep_length
+
+
+def walk_sweep(width, height, heading=Direction.D):
+    # follows the sweep from base the way CleanProgram does and returns every cell seen in the bot's 3x3 view,
+    # and the moves it took
+    x, y = 0, 0
+    seen = set()
+    moves = 0
+    for waypoint in plan_sweep(width, height):
+        while True:
+            seen.update((x + dx, y + dy) for dx in (-1, 0, 1) for dy in (-1, 0, 1))
+            action = step_towards((x, y), heading, waypoint)
+            if action is None:
+                break
+            if action == 'moveforward':
+                x, y = x + Direction.DX[heading], y + Direction.DY[heading]
+                moves += 1
+                assert 0 <= x < width and 0 <= y < height
+            else:
+                heading = (heading + (Direction.R if action == 'turnright' else Direction.L)) % 4
+    return seen, moves
+
+
+@pytest.mark.parametrize('width', range(1, 25))
+def test_sweep_sees_every_cell(width):
+    for height in range(1, 25):
+        seen, moves = walk_sweep(width, height)
+        unseen = [(x, y) for x in range(width) for y in range(height) if (x, y) not in seen]
+        assert not unseen, (width, height, unseen)
+        assert moves == sweep_length(plan_sweep(width, height))
+
+
+def test_shorter_way_round_is_picked():
+    for width in range(1, 25):
+        for height in range(1, 25):
+            columns = sweep_length(plan_lines(width, height))
+            rows = sweep_length([(x, y) for y, x in plan_lines(height, width)])
+            assert sweep_length(plan_sweep(width, height)) == min(columns, rows)
+    # a tall narrow room goes along its rows
+    assert sweep_length(plan_sweep(4, 30)) < sweep_length(plan_lines(4, 30))
@@ -0,0 +1,36 @@
+# Every stop condition in termination.py has to be able to end a run and be given as its reason
+from cleaning_robot import AllCleaned, CoverageReached, LiquidExhausted, StepBudget, make_room
+
+
+def run_until(condition):
+    room, bot = make_room(8, 4, 2, seed=1, stop_when=[condition])
+    return room.run(2000, headless=True)
+
+
+def test_all_cleaned():
+    result = run_until(AllCleaned())
+    assert result.reason == 'all cleaned'
+    assert result.cleaned == 4
+
+
+def test_liquid_exhausted():
+    # the bot cleans everything with the liquid it has and walks home empty, which also finishes the run
+    result = run_until(LiquidExhausted())
+    assert result.reason == 'liquid exhausted'
+    assert result.location == (0, 0)
+
+
+def test_step_budget():
+    result = run_until(StepBudget(5))
+    assert result.reason == 'step budget'
+    assert result.steps == 5
+
+
+def test_coverage_reached():
+    result = run_until(CoverageReached(0.5))
+    assert result.reason == 'coverage reached'
+
+
+def test_no_conditions():
+    room, bot = make_room(8, 4, 2, seed=1)
+    assert room.run(2000, headless=True).reason == 'finished'